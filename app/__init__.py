@@ -1,2 +1,4 @@
+import time
+BOOT_STARTED = time.perf_counter()
 from .app import create_app
 from .service import run_server
@@ -1,12 +1,25 @@
+import time
 import logging
+from typing import Optional
 from flask import Flask
-from .setup import configure_logging, setup_app
+from .setup import BootReport, configure_logging, setup_app
 
 logger = logging.getLogger(__name__)
 
+_import_started: Optional[float] = None
+
 
 def create_app() -> Flask:
+    global _import_started
+    from . import BOOT_STARTED
+    report = BootReport()
+    if _import_started is None:
+        _import_started = BOOT_STARTED
+        report.started = BOOT_STARTED
+        report.phases["import"] = time.perf_counter() - BOOT_STARTED
     configure_logging()
     app = Flask(__name__)
-    setup_app(app)
+    app.boot_report = report
+    setup_app(app, report)
+    report.log()
     return app
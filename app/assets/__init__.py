@@ -0,0 +1,2 @@
+from .build import build_assets, minify_css, minify_js
+from .manifest import AssetManifest, asset_manifest, asset_url, asset_srcset, assets_bp, init_assets
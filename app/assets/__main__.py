@@ -0,0 +1,6 @@
+import logging
+from .manifest import asset_manifest
+from .build import build_assets
+
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+build_assets(asset_manifest.static_dir, asset_manifest.build_dir)
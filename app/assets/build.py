@@ -0,0 +1,176 @@
+import os
+import re
+import gzip
+import json
+import hashlib
+import logging
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+TEXT_ASSETS = ("css/style.css", "css/assistant.css", "js/script.js", "js/assistant.js")
+IMAGE_WIDTHS = (320, 640, 960)
+MAX_IMAGE_WIDTH = 1280
+WEBP_QUALITY = 80
+MANIFEST_NAME = "manifest.json"
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def source_fingerprint(static_dir: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(_iter_sources(static_dir)):
+        stat = path.stat()
+        digest.update(
+            f"{path.relative_to(static_dir).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()[:16]
+
+
+def _iter_sources(static_dir: Path) -> Iterable[Path]:
+    for name in TEXT_ASSETS:
+        path = static_dir / name
+        if path.is_file():
+            yield path
+    assets_dir = static_dir / "assets"
+    if assets_dir.is_dir():
+        for path in assets_dir.rglob("*"):
+            if path.suffix.lower() in IMAGE_EXTENSIONS and path.is_file():
+                yield path
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
+
+def _hashed_name(rel_path: str, digest: str, suffix: Optional[str] = None, variant: str = "") -> str:
+    path = Path(rel_path)
+    return path.with_name(f"{path.stem}{variant}.{digest}{suffix or path.suffix}").as_posix()
+
+
+def minify_css(source: str) -> str:
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    lines = (line.strip() for line in source.splitlines())
+    source = "\n".join(line for line in lines if line)
+    source = re.sub(r"\s*([{};,>])\s*", r"\1", source)
+    return source.replace(";}", "}").strip() + "\n"
+
+
+def minify_js(source: str) -> str:
+    lines: List[str] = []
+    in_template = False
+    for line in source.splitlines():
+        stripped = line if in_template else line.strip()
+        if not in_template and (not stripped or stripped.startswith("//")):
+            continue
+        lines.append(stripped.rstrip() if not in_template else line)
+        in_template = _ends_in_template(line, in_template)
+    return "\n".join(lines) + "\n"
+
+
+def _ends_in_template(line: str, in_template: bool) -> bool:
+    quote: Optional[str] = None
+    escaped = False
+    for char in line:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_template:
+            in_template = char != "`"
+        elif quote:
+            quote = None if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char == "`":
+            in_template = True
+    return in_template
+
+
+def _compress(data: bytes) -> Dict[str, bytes]:
+    variants = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+        variants["br"] = brotli.compress(data, quality=11)
+    except ImportError:
+        pass
+    return variants
+
+
+def _build_text_asset(static_dir: Path, build_dir: Path, rel_path: str) -> Dict[str, Any]:
+    source = (static_dir / rel_path).read_text(encoding="utf-8")
+    minified = (minify_css if rel_path.endswith(".css") else minify_js)(source).encode("utf-8")
+    out_name = _hashed_name(rel_path, content_hash(minified), variant=".min")
+    _write_atomic(build_dir / out_name, minified)
+    encodings = []
+    for encoding, data in _compress(minified).items():
+        if len(data) < len(minified):
+            _write_atomic(build_dir / f"{out_name}{ENCODING_SUFFIXES[encoding]}", data)
+            encodings.append(encoding)
+    return {"url": out_name, "size": len(minified), "encodings": encodings}
+
+
+def _build_image(static_dir: Path, build_dir: Path, rel_path: str) -> Dict[str, Any]:
+    raw = (static_dir / rel_path).read_bytes()
+    digest = content_hash(raw)
+    original_name = _hashed_name(rel_path, digest)
+    _write_atomic(build_dir / original_name, raw)
+    entry: Dict[str, Any] = {"url": original_name, "srcset": []}
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return entry
+    with Image.open(static_dir / rel_path) as opened:
+        image = ImageOps.exif_transpose(opened)
+        entry["width"], entry["height"] = image.size
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        largest = min(image.width, MAX_IMAGE_WIDTH)
+        widths = sorted({w for w in IMAGE_WIDTHS if w < largest} | {largest}, reverse=True)
+        for width in widths:
+            out_name = _hashed_name(rel_path, digest, ".webp", f"-{width}w")
+            if not (build_dir / out_name).exists():
+                if width != image.width:
+                    image = image.resize(
+                        (width, round(image.height * width / image.width)), Image.LANCZOS)
+                _write_atomic(build_dir / out_name, _encode_webp(image))
+            entry["srcset"].insert(0, [out_name, width])
+    return entry
+
+
+def _encode_webp(image) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+    return buffer.getvalue()
+
+
+def build_assets(static_dir: Path, build_dir: Optional[Path] = None) -> Tuple[Dict[str, Any], Path]:
+    build_dir = build_dir or static_dir / "build"
+    files: Dict[str, Any] = {}
+    for path in _iter_sources(static_dir):
+        rel_path = path.relative_to(static_dir).as_posix()
+        try:
+            if path.suffix.lower() in IMAGE_EXTENSIONS:
+                files[rel_path] = _build_image(static_dir, build_dir, rel_path)
+            else:
+                files[rel_path] = _build_text_asset(static_dir, build_dir, rel_path)
+        except Exception as e:
+            logger.error(f"❌ Asset Build Failed ({rel_path}) - {e}")
+    manifest = {"fingerprint": source_fingerprint(static_dir), "files": files}
+    manifest_path = build_dir / MANIFEST_NAME
+    build_dir.mkdir(parents=True, exist_ok=True)
+    temp_path = manifest_path.with_name(f".{MANIFEST_NAME}.{os.getpid()}.tmp")
+    temp_path.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    os.replace(temp_path, manifest_path)
+    logger.info(f"✅ Assets Built ({len(files)} Files)")
+    return manifest, manifest_path
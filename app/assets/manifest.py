@@ -0,0 +1,175 @@
+import os
+import json
+import time
+import logging
+import mimetypes
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+from flask import Blueprint, Response, abort, request, send_from_directory, url_for
+from ..config import Config
+from .build import ENCODING_SUFFIXES, MANIFEST_NAME, build_assets, source_fingerprint
+
+logger = logging.getLogger(__name__)
+
+STATIC_PREFIX = "/static/"
+LOCK_NAME = ".build.lock"
+IMMUTABLE_MAX_AGE = 31536000
+
+assets_bp = Blueprint('assets', __name__)
+
+
+class AssetManifest:
+    def __init__(self, static_dir: Path, check_interval: float = 5.0):
+        self.static_dir = static_dir
+        self.build_dir = static_dir / "build"
+        self.check_interval = check_interval
+        self.files: Dict[str, Any] = {}
+        self.outputs: Dict[str, Any] = {}
+        self.fingerprint: Optional[str] = None
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.build_dir / MANIFEST_NAME
+
+    def load(self) -> bool:
+        try:
+            mtime = self.manifest_path.stat().st_mtime
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        with self._lock:
+            self.files = manifest.get("files", {})
+            self.outputs = {entry["url"]: entry for entry in self.files.values()}
+            self.fingerprint = manifest.get("fingerprint")
+            self._mtime = mtime
+        return True
+
+    def is_fresh(self) -> bool:
+        return self.load() and self.fingerprint == source_fingerprint(self.static_dir)
+
+    @property
+    def lock_path(self) -> Path:
+        return self.build_dir / LOCK_NAME
+
+    def _acquire_build_lock(self, lease_seconds: float) -> bool:
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - self.lock_path.stat().st_mtime > lease_seconds:
+                    logger.warning("⚠️ Stale Asset Build Lock - Reclaiming")
+                    self.lock_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return False
+        with os.fdopen(fd, "w") as lock_file:
+            lock_file.write(str(os.getpid()))
+        return True
+
+    def build(self, poll_interval: float = 0.25) -> None:
+        lease_seconds = Config.ASSETS_BUILD_LEASE
+        deadline = time.monotonic() + lease_seconds
+        try:
+            self.build_dir.mkdir(parents=True, exist_ok=True)
+            while not self._acquire_build_lock(lease_seconds):
+                if time.monotonic() >= deadline:
+                    logger.warning("⚠️ Asset Build Lock Wait Timed Out")
+                    return
+                time.sleep(poll_interval)
+                if self.is_fresh():
+                    return
+            try:
+                if not self.is_fresh():
+                    build_assets(self.static_dir, self.build_dir)
+            finally:
+                self.lock_path.unlink(missing_ok=True)
+            self.load()
+        except Exception as e:
+            logger.error(f"❌ Asset Build Failed - {e}")
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+        try:
+            mtime = self.manifest_path.stat().st_mtime
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self.load()
+
+    def entry(self, path: str) -> Optional[Dict[str, Any]]:
+        self._refresh()
+        if path.startswith(STATIC_PREFIX):
+            path = path[len(STATIC_PREFIX):]
+        return self.files.get(path.lstrip("/"))
+
+    def url(self, path: str, width: Optional[int] = None) -> str:
+        entry = self.entry(path)
+        if entry:
+            filename = entry["url"]
+            if width and entry.get("srcset"):
+                filename = next((name for name, size in entry["srcset"] if size >= width),
+                                entry["srcset"][-1][0])
+            return url_for('assets.build_file', filename=filename)
+        if path.startswith(STATIC_PREFIX) or "://" in path:
+            return path
+        return url_for('static', filename=path)
+
+    def srcset(self, path: str) -> str:
+        entry = self.entry(path)
+        if not entry:
+            return ""
+        return ", ".join(
+            f"{url_for('assets.build_file', filename=name)} {width}w" for name, width in entry.get("srcset", ()))
+
+
+asset_manifest = AssetManifest(Path(__file__).resolve().parent.parent / "static")
+
+
+def asset_url(path: str, width: Optional[int] = None) -> str:
+    return asset_manifest.url(path, width) if path else ""
+
+
+def asset_srcset(path: str) -> str:
+    return asset_manifest.srcset(path) if path else ""
+
+
+def init_assets() -> None:
+    if asset_manifest.is_fresh() or not Config.ASSETS_AUTO_BUILD:
+        return
+    if Config.PRELOAD_APP:
+        asset_manifest.build()
+    else:
+        threading.Thread(target=asset_manifest.build,
+                         name="asset-build", daemon=True).start()
+
+
+def _accepted_encoding(filename: str) -> Optional[str]:
+    entry = asset_manifest.outputs.get(filename) or {}
+    for encoding in ("br", "gzip"):
+        if encoding in entry.get("encodings", ()) and encoding in request.accept_encodings:
+            return encoding
+    return None
+
+
+@assets_bp.route('/static/build/<path:filename>')
+def build_file(filename: str) -> Response:
+    if filename == MANIFEST_NAME:
+        abort(404)
+    encoding = _accepted_encoding(filename)
+    served_name = filename + ENCODING_SUFFIXES[encoding] if encoding else filename
+    response = send_from_directory(
+        asset_manifest.build_dir, served_name, max_age=IMMUTABLE_MAX_AGE)
+    if encoding:
+        response.content_encoding = encoding
+        response.mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
@@ -1,2 +1,7 @@
 from .assistant import init_assistant
+from .assistant_models import ModelRouter, model_router, classify_error
+from .assistant_query import (
+    KeywordMatcher, FuzzyMatcher, QueryRoute, QueryRouter, build_query_router, get_query_router
+)
 from .assistant_service import AssistantService
+from .assistant_state import ConversationState, SessionHistoryBuffer, history_buffer
@@ -1,19 +1,24 @@
 import os
 import re
 import logging
-from typing import Dict, List, Optional
-from google import genai
-from google.genai import types
+import threading
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+from ..cache import single_flight
 from ..config import Config
 from ..db import (
-    get_ai_config, get_chat_history, get_all_database, get_user_profile,
-    get_cached_ai_response, set_cached_ai_response,
-    get_all_projects, get_all_posts, get_all_certifications,
-    get_all_skills, get_services, get_timeline, get_stats,
-    get_cached_valid_models, set_cached_valid_models
+    get_ai_config, get_cached_ai_response, set_cached_ai_response,
+    get_cached_valid_models, set_cached_valid_models, get_content_version
 )
 from ..social import GitHubPortfolio, LinkedInPortfolio
 from ..utils import load_json_file
+from .assistant_prompt import (
+    PromptBuilder, build_context_sections, assemble_context, get_context_budget,
+    get_base_instructions
+)
+
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
 
 logger = logging.getLogger(__name__)
 
@@ -46,13 +51,28 @@ def load_quick_responses() -> Dict[str, str]:
 def get_valid_models() -> List[str]:
     if cached_models := get_cached_valid_models():
         return cached_models
+    return single_flight.do(
+        "gemini_models",
+        _fetch_valid_models,
+        lookup=get_cached_valid_models,
+        lease_seconds=Config.SINGLE_FLIGHT_LEASE
+    )
+
+
+def get_default_models() -> List[str]:
+    fallback_models = get_ai_config().get("fallback_models", [])
+    env_preferred = os.getenv("GEMINI_MODEL")
+    default_stack = [env_preferred] if env_preferred else []
+    return default_stack + [m for m in fallback_models if m not in default_stack]
+
+
+def _fetch_valid_models() -> List[str]:
     client = AssistantCoreLogic.get_shared_client()
     ai_config = get_ai_config()
     fallback_models = ai_config.get("fallback_models", [])
     env_preferred = os.getenv("GEMINI_MODEL")
-    default_stack = [env_preferred] if env_preferred else []
     if not client:
-        return default_stack + [m for m in fallback_models if m not in default_stack]
+        return get_default_models()
     try:
         api_response = client.models.list()
         available_names = {m.name.replace("models/", "") for m in api_response}
@@ -65,42 +85,74 @@ def get_valid_models() -> List[str]:
             return valid_stack
     except Exception as e:
         logger.error(f"❌ Failed to Fetch Models from API: {e}")
-    return default_stack + [m for m in fallback_models if m not in default_stack]
+    return get_default_models()
+
+
+FOLLOW_UP_TERMS = frozenset({
+    "it", "its", "that", "this", "those", "these", "they", "them", "their",
+    "more", "else", "above", "previous", "earlier", "again", "same", "another",
+    "other", "elaborate", "continue", "also", "why", "one", "ones", "first",
+    "second", "third", "last"
+})
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(re.sub(r"[^\w\s+#]", " ", query.lower()).split())
 
 
-def is_query_relevant(query: str, ai_config: dict) -> bool:
-    allowed_keywords = ai_config.get("allowed_keywords", ["krishna", "verma"])
-    query_lower = query.lower()
-    if query_lower in {"hi", "hello", "hey", "hola"}:
-        return True
-    pattern = re.compile(
-        rf"\b({'|'.join(map(re.escape, allowed_keywords))})\b", re.IGNORECASE)
-    return bool(pattern.search(query_lower))
+def is_follow_up_query(normalized_query: str) -> bool:
+    return any(word in FOLLOW_UP_TERMS for word in normalized_query.split())
 
 
 class AssistantCoreLogic:
-    _SHARED_CLIENT: Optional[genai.Client] = None
+    _SHARED_CLIENT: Optional["genai.Client"] = None
+    CONTEXT_CACHE_KEY = "GLOBAL_CONTEXT"
 
     def __init__(self):
-        self.client = self.get_shared_client()
         self.ai_config = get_ai_config()
-        self.model_stack = get_valid_models()
-        self.is_online = bool(self.client and self.model_stack)
+        self.model_stack = get_cached_valid_models() or get_default_models()
+        self.is_online = bool(Config.GEMINI_API_KEY and self.model_stack)
         self.quick_responses = load_quick_responses()
         self._CONTEXT_EXPIRY_HOURS = 1
+        self._github: Optional[GitHubPortfolio] = None
+        self.prompt = PromptBuilder(
+            self._get_context, max_age_seconds=self._CONTEXT_EXPIRY_HOURS * 3600,
+            get_sections=lambda: build_context_sections(self._get_github_repos()))
 
     @classmethod
-    def get_shared_client(cls) -> Optional[genai.Client]:
+    def get_shared_client(cls) -> Optional["genai.Client"]:
         if cls._SHARED_CLIENT is None and Config.GEMINI_API_KEY:
             try:
+                from google import genai
                 cls._SHARED_CLIENT = genai.Client(
                     api_key=Config.GEMINI_API_KEY)
             except Exception as e:
                 logger.error(f"❌ GenAI Client Error: {e}")
         return cls._SHARED_CLIENT
 
-    def generate_content(self, model_name: str, instructions: str, history: List[types.Content], user_input: str) -> str:
-        chat = self.client.chats.create(
+    @classmethod
+    def reset_shared_client(cls) -> None:
+        cls._SHARED_CLIENT = None
+
+    @property
+    def client(self) -> Optional["genai.Client"]:
+        return self.get_shared_client()
+
+    def warm_up(self) -> None:
+        if not self.is_online:
+            return
+        self.get_shared_client()
+        self.model_stack = get_valid_models() or self.model_stack
+
+    def warm_up_in_background(self) -> threading.Thread:
+        thread = threading.Thread(
+            target=self.warm_up, name="assistant-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def _create_chat(self, model_name: str, instructions: str, history: List["types.Content"]):
+        from google.genai import types
+        return self.client.chats.create(
             model=model_name,
             history=history,
             config=types.GenerateContentConfig(
@@ -108,17 +160,41 @@ class AssistantCoreLogic:
                 temperature=0.7
             )
         )
+
+    def generate_content(self, model_name: str, instructions: str, history: List["types.Content"], user_input: str) -> str:
+        chat = self._create_chat(model_name, instructions, history)
         return chat.send_message(user_input).text.strip()
 
-    def build_instructions(self) -> str:
-        base = self.ai_config.get("system_instruction", [
-                                  "You are a Virtual AI Assistant."])
-        return "\n".join(base).replace("{context_data}", self._get_context())
+    def stream_content(self, model_name: str, instructions: str, history: List["types.Content"], user_input: str) -> Iterator[str]:
+        chat = self._create_chat(model_name, instructions, history)
+        for chunk in chat.send_message_stream(user_input):
+            if chunk.text:
+                yield chunk.text
+
+    def build_instructions(self, query: Optional[str] = None) -> str:
+        if query:
+            return self.prompt.get_for_query(query).text
+        return self.prompt.get().text
+
+    def refresh_context(self) -> None:
+        self._build_context(self.context_cache_key, get_base_instructions())
+
+    def sync_local_state(self) -> None:
+        self.model_stack = get_cached_valid_models() or self.model_stack
+        self.prompt.warm()
+
+    @property
+    def context_cache_key(self) -> str:
+        return f"{self.CONTEXT_CACHE_KEY}:{get_content_version()}"
+
+    @property
+    def prompt_stats(self) -> Dict:
+        return self.prompt.stats
 
-    def format_history(self, session_id: str) -> List[types.Content]:
-        raw = get_chat_history(session_id)
+    def format_history(self, entries: List) -> List["types.Content"]:
+        from google.genai import types
         history = []
-        for entry in raw:
+        for entry in entries:
             if not (entry.user_query and entry.bot_response and entry.bot_response.strip()):
                 continue
             history.append(types.Content(role="user", parts=[
@@ -127,77 +203,37 @@ class AssistantCoreLogic:
                            types.Part.from_text(text=entry.bot_response)]))
         return history
 
-    def _get_context(self) -> str:
-        cache_key = "GLOBAL_CONTEXT"
+    def _get_context(self, base_instructions: str) -> str:
+        cache_key = self.context_cache_key
         if cached := get_cached_ai_response(cache_key, expiry_hours=self._CONTEXT_EXPIRY_HOURS):
             return cached
+        return single_flight.do(
+            cache_key,
+            lambda: self._build_context(cache_key, base_instructions),
+            lookup=lambda: get_cached_ai_response(
+                cache_key, expiry_hours=self._CONTEXT_EXPIRY_HOURS, refresh=True),
+            lease_seconds=Config.SINGLE_FLIGHT_LEASE
+        )
+
+    def _build_context(self, cache_key: str, base_instructions: str) -> str:
         try:
-            user = get_user_profile() or {}
-            stats = get_stats() or {}
-            skills = get_all_skills() or []
-            services = get_services() or []
-            academic_tl = get_timeline('academic') or []
-            journey_tl = get_timeline('journey') or []
-            projects = get_all_projects() or []
-            posts = get_all_posts() or []
-            certs = get_all_certifications() or []
-            database = get_all_database() or []
-            try:
-                github_repos = GitHubPortfolio().get_projects(limit=4) or []
-            except Exception as e:
-                logger.warning(f"⚠️ GitHub Portfolio Fetch Failed: {e}")
-                github_repos = []
-
-            def get_val(obj, attr_name):
-                return getattr(obj, attr_name, "")
-
-            def format_list(items, primary_attr, secondary_attr=None):
-                if not items:
-                    return "None"
-                if secondary_attr:
-                    return "\n".join(f"* {get_val(i, primary_attr)}: {get_val(i, secondary_attr)}" for i in items)
-                return "\n".join(f"* {get_val(i, primary_attr)}" for i in items)
-            blocks = [
-                "[ PROFILE ]",
-                f"Name: {user.get('name', 'Krishna')} | Title: {user.get('title', 'Developer')} | Location: {user.get('location', 'Hapur')}",
-                f"Bio: {user.get('philosophy', 'A passionate developer.')}",
-                f"Contact: {user.get('contact_email', user.get('email', 'N/A'))}",
-                "",
-                "[ STATS ]",
-                f"Projects: {stats.get('projects_completed', 0)} | Certifications: {stats.get('certifications', 0)} | Commits: {stats.get('commits_made', 0)}",
-                "",
-                "[ SKILLS ]",
-                " ".join(get_val(s, 'name')
-                         for s in skills) or "None",
-                "",
-                "[ SERVICES ]",
-                format_list(services, 'title', 'description'),
-                "",
-                "[ ACADEMIC ]",
-                format_list(academic_tl, 'year', 'title'),
-                "",
-                "[ JOURNEY ]",
-                format_list(journey_tl, 'year', 'title'),
-                "",
-                "[ GITHUB ]",
-                "\n".join(
-                    f"* {r.get('name', '')}: {r.get('description', '')}" for r in github_repos) or "None",
-                "",
-                "[ PROJECTS ]",
-                format_list(projects, 'title'),
-                "",
-                "[ CERTIFICATIONS ]",
-                format_list(certs, 'title'),
-                "",
-                "[ BLOGS ]",
-                format_list(posts, 'title')
-            ]
-            if database:
-                blocks.extend(["", "[ DATABASE ]", format_list(
-                    database, 'category', 'info')])
-            context_string = "\n".join(blocks).strip()
+            sections = build_context_sections(self._get_github_repos())
+            context_string, dropped = assemble_context(
+                sections, get_context_budget(base_instructions))
+            if dropped:
+                logger.info(
+                    f"✅ Prompt Trimmed to Budget - Dropped {', '.join(dropped)}")
             set_cached_ai_response(cache_key, context_string)
             return context_string
         except Exception as e:
             logger.error(f"❌ Context Build Error: {e}")
             return "Professional Full Stack Developer Context."
+
+    def _get_github_repos(self) -> List[dict]:
+        try:
+            if self._github is None:
+                self._github = GitHubPortfolio()
+            return self._github.get_projects(limit=4) or []
+        except Exception as e:
+            logger.warning(f"⚠️ GitHub Portfolio Fetch Failed: {e}")
+            return []
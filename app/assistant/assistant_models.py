@@ -0,0 +1,190 @@
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RATE_LIMITED = "rate_limited"
+UNAVAILABLE = "unavailable"
+FATAL = "fatal"
+ERROR = "error"
+
+
+def classify_error(error: BaseException) -> str:
+    code = getattr(error, "code", None)
+    status = str(getattr(error, "status", "") or "")
+    if code == 429 or status == "RESOURCE_EXHAUSTED":
+        return RATE_LIMITED
+    if isinstance(code, int) and code >= 500 or status == "UNAVAILABLE" or isinstance(error, TimeoutError):
+        return UNAVAILABLE
+    if isinstance(code, int) and 400 <= code < 500:
+        return FATAL
+    return ERROR
+
+
+@dataclass
+class ModelHealth:
+    name: str
+    latency_ewma: Optional[float] = None
+    error_rate: float = 0.0
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    trips: int = 0
+    open_until: float = 0.0
+    last_error: Optional[str] = None
+
+    def is_open(self, now: float) -> bool:
+        return now < self.open_until
+
+
+class ModelRouter:
+    def __init__(self, alpha: float = 0.3, failure_threshold: int = 3, cooldown_seconds: float = 30.0,
+                 rate_limit_cooldown: float = 60.0, max_cooldown: float = 900.0,
+                 default_latency: float = 5.0, hedge_after_ms: int = 0):
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.rate_limit_cooldown = rate_limit_cooldown
+        self.max_cooldown = max_cooldown
+        self.default_latency = default_latency
+        self.hedge_after_ms = hedge_after_ms
+        self._health: Dict[str, ModelHealth] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hedges = 0
+
+    def _get(self, model_name: str) -> ModelHealth:
+        health = self._health.get(model_name)
+        if health is None:
+            health = self._health[model_name] = ModelHealth(model_name)
+        return health
+
+    def candidates(self, models: Sequence[str]) -> List[str]:
+        now = time.monotonic()
+        with self._lock:
+            ranked = []
+            for index, model_name in enumerate(models):
+                health = self._get(model_name)
+                if health.is_open(now):
+                    continue
+                latency = health.latency_ewma if health.latency_ewma is not None else self.default_latency
+                ranked.append((latency * (1 + 2 * health.error_rate), index, model_name))
+        return [model_name for _, _, model_name in sorted(ranked)]
+
+    def record_success(self, model_name: str, latency: float) -> None:
+        with self._lock:
+            health = self._get(model_name)
+            health.successes += 1
+            health.consecutive_failures = 0
+            health.trips = 0
+            health.open_until = 0.0
+            health.error_rate *= 1 - self.alpha
+            health.latency_ewma = latency if health.latency_ewma is None else \
+                self.alpha * latency + (1 - self.alpha) * health.latency_ewma
+
+    def record_failure(self, model_name: str, error: BaseException) -> str:
+        kind = classify_error(error)
+        with self._lock:
+            health = self._get(model_name)
+            health.failures += 1
+            health.consecutive_failures += 1
+            health.error_rate = self.alpha + (1 - self.alpha) * health.error_rate
+            health.last_error = f"{kind}: {error}"
+            if kind == RATE_LIMITED:
+                cooldown = self.rate_limit_cooldown
+            elif kind == FATAL:
+                cooldown = self.max_cooldown
+            elif health.consecutive_failures >= self.failure_threshold:
+                cooldown = self.cooldown_seconds
+            else:
+                return kind
+            cooldown = min(self.max_cooldown, cooldown * 2 ** health.trips)
+            health.trips += 1
+            health.open_until = time.monotonic() + cooldown
+        logger.warning(
+            f"⚠️ Model Circuit Opened ({model_name}) for {int(cooldown)}s - {kind}")
+        return kind
+
+    def call(self, models: Sequence[str], fn: Callable[[str], T]) -> Tuple[Optional[T], Optional[str]]:
+        pending = self.candidates(models)
+        while pending:
+            model_name = pending.pop(0)
+            if self.hedge_after_ms and pending:
+                result, used_model = self._call_hedged(model_name, pending, fn)
+            else:
+                result, used_model = self._attempt(model_name, fn), model_name
+            if result is not None:
+                return result, used_model
+        return None, None
+
+    def _attempt(self, model_name: str, fn: Callable[[str], T]) -> Optional[T]:
+        started = time.perf_counter()
+        try:
+            result = fn(model_name)
+            if not result:
+                raise ValueError("Empty Response from Model")
+        except Exception as e:
+            self.record_failure(model_name, e)
+            return None
+        self.record_success(model_name, time.perf_counter() - started)
+        return result
+
+    def _call_hedged(self, model_name: str, pending: List[str], fn: Callable[[str], T]) -> Tuple[Optional[T], Optional[str]]:
+        executor = self._get_executor()
+        futures = {executor.submit(self._attempt, model_name, fn): model_name}
+        done, _ = wait(futures, timeout=self.hedge_after_ms / 1000)
+        if not done:
+            backup = pending.pop(0)
+            futures[executor.submit(self._attempt, backup, fn)] = backup
+            self.hedges += 1
+        for future in as_completed(futures):
+            result = future.result()
+            if result is not None:
+                return result, futures[future]
+        return None, None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="gemini-hedge")
+            return self._executor
+
+    def reset(self) -> None:
+        self._lock = threading.Lock()
+        self._executor = None
+        self._health.clear()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "hedges": self.hedges,
+                "models": {
+                    name: {
+                        "latency_ms": round(h.latency_ewma * 1000) if h.latency_ewma is not None else None,
+                        "error_rate": round(h.error_rate, 3),
+                        "successes": h.successes,
+                        "failures": h.failures,
+                        "open": h.is_open(now),
+                        "last_error": h.last_error
+                    }
+                    for name, h in self._health.items()
+                }
+            }
+
+
+model_router = ModelRouter(
+    failure_threshold=Config.MODEL_FAILURE_THRESHOLD,
+    cooldown_seconds=Config.MODEL_COOLDOWN_SECONDS,
+    rate_limit_cooldown=Config.MODEL_RATE_LIMIT_COOLDOWN,
+    hedge_after_ms=Config.GEMINI_HEDGE_AFTER_MS
+)
@@ -0,0 +1,319 @@
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from ..config import Config
+from ..db import (
+    get_ai_config, get_all_database, get_user_profile, get_all_projects,
+    get_all_posts, get_all_certifications, get_all_skills, get_services,
+    get_timeline, get_stats, get_content_version, BM25Index, tokenize
+)
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_PLACEHOLDER = "{context_data}"
+PINNED_PRIORITY = 100
+
+
+@dataclass(frozen=True)
+class PromptSection:
+    name: str
+    body: str
+    priority: int
+
+    @property
+    def text(self) -> str:
+        return f"[ {self.name} ]\n{self.body}"
+
+
+@dataclass(frozen=True)
+class BuiltPrompt:
+    version: str
+    text: str
+    tokens: int
+    context_tokens: int
+    built_at: float
+
+
+@dataclass(frozen=True)
+class PromptChunk:
+    section: str
+    order: int
+    body: str
+    priority: int
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + 3) // 4 if text else 0
+
+
+def _get_val(obj: Any, attr_name: str) -> Any:
+    return getattr(obj, attr_name, "")
+
+
+def _format_list(items: Sequence[Any], primary_attr: str, secondary_attr: Optional[str] = None) -> str:
+    if not items:
+        return "None"
+    if secondary_attr:
+        return "\n".join(f"* {_get_val(i, primary_attr)}: {_get_val(i, secondary_attr)}" for i in items)
+    return "\n".join(f"* {_get_val(i, primary_attr)}" for i in items)
+
+
+def build_context_sections(github_repos: Sequence[Mapping[str, Any]]) -> List[PromptSection]:
+    user = get_user_profile() or {}
+    stats = get_stats() or {}
+    sections = [
+        PromptSection("PROFILE", "\n".join([
+            f"Name: {user.get('name', 'Krishna')} | Title: {user.get('title', 'Developer')} | Location: {user.get('location', 'Hapur')}",
+            f"Bio: {user.get('philosophy', 'A passionate developer.')}",
+            f"Contact: {user.get('contact_email', user.get('email', 'N/A'))}"
+        ]), PINNED_PRIORITY),
+        PromptSection(
+            "STATS", f"Projects: {stats.get('projects_completed', 0)} | Certifications: {stats.get('certifications', 0)} | Commits: {stats.get('commits_made', 0)}", 90),
+        PromptSection("SKILLS", " ".join(_get_val(s, 'name')
+                      for s in get_all_skills()) or "None", 80),
+        PromptSection("SERVICES", _format_list(
+            get_services(), 'title', 'description'), 60),
+        PromptSection("ACADEMIC", _format_list(
+            get_timeline('academic'), 'year', 'title'), 50),
+        PromptSection("JOURNEY", _format_list(
+            get_timeline('journey'), 'year', 'title'), 45),
+        PromptSection("GITHUB", "\n".join(
+            f"* {r.get('name', '')}: {r.get('description', '')}" for r in github_repos) or "None", 55),
+        PromptSection("PROJECTS", _format_list(
+            get_all_projects(), 'title'), 70),
+        PromptSection("CERTIFICATIONS", _format_list(
+            get_all_certifications(), 'title'), 20),
+        PromptSection("BLOGS", _format_list(get_all_posts(), 'title'), 30)
+    ]
+    database = get_all_database()
+    if database:
+        sections.append(PromptSection("DATABASE", _format_list(
+            database, 'category', 'info'), 10))
+    return sections
+
+
+def assemble_context(sections: Sequence[PromptSection], token_budget: Optional[int]) -> Tuple[str, Tuple[str, ...]]:
+    kept = list(sections)
+    dropped: List[str] = []
+
+    def render() -> str:
+        return "\n\n".join(section.text for section in kept).strip()
+
+    if token_budget:
+        for section in sorted(sections, key=lambda s: s.priority):
+            if estimate_tokens(render()) <= token_budget:
+                break
+            if section.priority >= PINNED_PRIORITY:
+                continue
+            kept.remove(section)
+            dropped.append(section.name)
+    return render(), tuple(dropped)
+
+
+def _split_entries(body: str) -> List[str]:
+    entries: List[str] = []
+    for line in body.splitlines():
+        if entries and line.strip() and not line.startswith("* "):
+            entries[-1] += "\n" + line
+        elif line.strip():
+            entries.append(line)
+    return entries
+
+
+def chunk_sections(sections: Sequence[PromptSection], chunk_tokens: int) -> List[PromptChunk]:
+    chunks: List[PromptChunk] = []
+    for section in sections:
+        if section.priority >= PINNED_PRIORITY:
+            continue
+        current: List[str] = []
+        for entry in _split_entries(section.body):
+            if current and estimate_tokens("\n".join(current + [entry])) > chunk_tokens:
+                chunks.append(PromptChunk(section.name, len(chunks), "\n".join(current), section.priority))
+                current = []
+            current.append(entry)
+        if current:
+            chunks.append(PromptChunk(section.name, len(chunks), "\n".join(current), section.priority))
+    return chunks
+
+
+class ContextRetriever:
+    def __init__(self, sections: Sequence[PromptSection], chunk_tokens: int = 120,
+                 ignored_terms: Sequence[str] = ()):
+        self.pinned = [section for section in sections if section.priority >= PINNED_PRIORITY]
+        self.chunks = chunk_sections(sections, chunk_tokens)
+        self.index = BM25Index([tokenize(f"{c.section} {c.body}") for c in self.chunks])
+        self.ignored_terms = frozenset(ignored_terms)
+        self.built_at = time.monotonic()
+
+    def select(self, query: str, token_budget: int, top_k: int, min_ratio: float = 0.25) -> str:
+        query_tokens = [t for t in tokenize(query) if t not in self.ignored_terms]
+        scored = self.index.top(query_tokens, len(self.chunks))
+        floor = scored[0][0] * min_ratio if scored else 0.0
+        ranked = [self.chunks[doc_id] for score, doc_id in scored if score >= floor]
+        if not ranked:
+            ranked = sorted(self.chunks, key=lambda c: (-c.priority, c.order))
+        budget = token_budget - estimate_tokens("\n\n".join(s.text for s in self.pinned))
+        chosen: List[PromptChunk] = []
+        for chunk in ranked:
+            if len(chosen) >= top_k:
+                break
+            cost = estimate_tokens(chunk.body) + 4
+            if cost <= budget:
+                chosen.append(chunk)
+                budget -= cost
+        return self.render(chosen)
+
+    def render(self, chunks: Sequence[PromptChunk]) -> str:
+        grouped: Dict[str, List[str]] = {}
+        for chunk in sorted(chunks, key=lambda c: c.order):
+            grouped.setdefault(chunk.section, []).append(chunk.body)
+        parts = [section.text for section in self.pinned]
+        parts += [PromptSection(name, "\n".join(bodies), 0).text for name, bodies in grouped.items()]
+        return "\n\n".join(parts).strip()
+
+
+def get_base_instructions() -> str:
+    base = get_ai_config().get("system_instruction", [
+        "You are a Virtual AI Assistant."])
+    return "\n".join(base)
+
+
+def get_context_budget(base_instructions: str) -> Optional[int]:
+    if not Config.PROMPT_TOKEN_BUDGET:
+        return None
+    base_tokens = estimate_tokens(base_instructions.replace(CONTEXT_PLACEHOLDER, ""))
+    return max(1, Config.PROMPT_TOKEN_BUDGET - base_tokens)
+
+
+class PromptBuilder:
+    def __init__(self, get_context: Callable[[str], str], max_age_seconds: float = 3600,
+                 get_sections: Optional[Callable[[], List[PromptSection]]] = None):
+        self.get_context = get_context
+        self.get_sections = get_sections
+        self.max_age_seconds = max_age_seconds
+        self._built: Optional[BuiltPrompt] = None
+        self._retriever: Optional[Tuple[str, ContextRetriever]] = None
+        self._retrievals = 0
+        self._retrieved_tokens = 0
+        self._prompt_tokens = 0
+        self._last_prompt_tokens = 0
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    def _is_fresh(self, built: Optional[BuiltPrompt], version: str, max_age: Optional[float] = None) -> bool:
+        max_age = self.max_age_seconds if max_age is None else max_age
+        return bool(built and built.version == version and time.monotonic() - built.built_at < max_age)
+
+    def get_for_query(self, query: str) -> BuiltPrompt:
+        if not (Config.PROMPT_RETRIEVAL and self.get_sections and query):
+            return self.get()
+        version = get_content_version()
+        retriever = self._get_retriever(version)
+        base = get_base_instructions()
+        budget = Config.PROMPT_RETRIEVAL_BUDGET
+        full_budget = get_context_budget(base)
+        context = retriever.select(
+            query, min(budget, full_budget) if full_budget else budget, Config.PROMPT_RETRIEVAL_TOP_K)
+        text = base.replace(CONTEXT_PLACEHOLDER, context)
+        context_tokens = estimate_tokens(context)
+        tokens = estimate_tokens(text)
+        with self._stats_lock:
+            self._retrievals += 1
+            self._retrieved_tokens += context_tokens
+            self._prompt_tokens += tokens
+            self._last_prompt_tokens = tokens
+        return BuiltPrompt(version, text, tokens, context_tokens, retriever.built_at)
+
+    def _is_current(self, cached: Optional[Tuple[str, ContextRetriever]], version: str,
+                    max_age: Optional[float] = None) -> bool:
+        max_age = self.max_age_seconds if max_age is None else max_age
+        return bool(cached and cached[0] == version and time.monotonic() - cached[1].built_at < max_age)
+
+    def _get_retriever(self, version: str, max_age: Optional[float] = None) -> ContextRetriever:
+        cached = self._retriever
+        if self._is_current(cached, version, max_age):
+            return cached[1]
+        with self._lock:
+            cached = self._retriever
+            if not self._is_current(cached, version, max_age):
+                owner = (get_user_profile() or {}).get("name", "")
+                retriever = ContextRetriever(self.get_sections(), Config.PROMPT_CHUNK_TOKENS, tokenize(owner))
+                self._retriever = cached = (version, retriever)
+                logger.info(f"✅ Context Index Built ({version}) - {len(retriever.chunks)} Chunks")
+            return cached[1]
+
+    def get(self, max_age: Optional[float] = None) -> BuiltPrompt:
+        version = get_content_version()
+        built = self._built
+        if self._is_fresh(built, version, max_age):
+            return built
+        with self._lock:
+            if self._is_fresh(self._built, version, max_age):
+                return self._built
+            self._built = self._build(version)
+            return self._built
+
+    def warm(self) -> None:
+        max_age = self.max_age_seconds / 2
+        if Config.PROMPT_RETRIEVAL and self.get_sections:
+            self._get_retriever(get_content_version(), max_age)
+        else:
+            self.get(max_age)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._built = None
+            self._retriever = None
+
+    def _build(self, version: str) -> BuiltPrompt:
+        base = get_base_instructions()
+        context = self.get_context(base)
+        text = base.replace(CONTEXT_PLACEHOLDER, context)
+        built = BuiltPrompt(
+            version=version,
+            text=text,
+            tokens=estimate_tokens(text),
+            context_tokens=estimate_tokens(context),
+            built_at=time.monotonic()
+        )
+        logger.info(f"✅ System Prompt Built ({version}) - ~{built.tokens} Tokens")
+        return built
+
+    def _retrieval_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            retrievals, retrieved_tokens = self._retrievals, self._retrieved_tokens
+            prompt_tokens, last_prompt_tokens = self._prompt_tokens, self._last_prompt_tokens
+        stats: Dict[str, Any] = {
+            "retrievals": retrievals,
+            "avg_retrieved_tokens": round(retrieved_tokens / retrievals) if retrievals else 0,
+            "last_prompt_tokens": last_prompt_tokens,
+            "avg_prompt_tokens": round(prompt_tokens / retrievals) if retrievals else 0
+        }
+        cached = self._retriever
+        if cached:
+            version, retriever = cached
+            stats["retriever"] = {
+                "version": version,
+                "built_at": retriever.built_at,
+                "age_seconds": round(time.monotonic() - retriever.built_at, 1),
+                "chunks": len(retriever.chunks)
+            }
+        return stats
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        built = self._built
+        stats = {
+            "version": None,
+            "tokens": 0,
+            "budget": Config.PROMPT_TOKEN_BUDGET,
+            "retrieval": bool(Config.PROMPT_RETRIEVAL and self.get_sections),
+            **self._retrieval_stats()
+        }
+        if built:
+            stats.update(version=built.version, tokens=built.tokens, context_tokens=built.context_tokens)
+        elif "retriever" in stats:
+            stats.update(version=stats["retriever"]["version"], tokens=stats["last_prompt_tokens"])
+        return stats
@@ -0,0 +1,207 @@
+import hashlib
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+from ..config import Config
+from ..db import get_ai_config, get_content_snapshot, get_content_version, tokenize
+from .assistant_logic import normalize_query, is_follow_up_query, load_quick_responses
+
+logger = logging.getLogger(__name__)
+
+QUICK = "quick"
+CACHED = "cached"
+REFUSE = "refuse"
+LLM = "llm"
+
+GREETINGS = frozenset({"hi", "hello", "hey", "hola"})
+
+ENTITY_FIELDS = {
+    "projects": "title", "blog_posts": "title", "skills": "name",
+    "certifications": "title", "services": "title"
+}
+
+
+def global_reply_key(normalized_query: str, version: Optional[str] = None) -> str:
+    raw_key = f"ai_reply_global_{version or get_content_version()}_{normalized_query}"
+    return hashlib.sha256(raw_key.encode()).hexdigest()
+
+
+class KeywordMatcher:
+    def __init__(self, patterns: Iterable[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple[str, ...]] = [()]
+        for pattern in patterns:
+            canonical = normalize_query(pattern)
+            if canonical:
+                self._insert(f" {canonical} ", pattern)
+        self._link()
+
+    def _insert(self, key: str, pattern: str) -> None:
+        state = 0
+        for char in key:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(())
+            state = next_state
+        if pattern not in self.output[state]:
+            self.output[state] += (pattern,)
+
+    def _link(self) -> None:
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def _scan(self, canonical: str):
+        state = 0
+        for char in f" {canonical} ":
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            if self.output[state]:
+                yield self.output[state]
+
+    def search(self, canonical: str) -> Optional[str]:
+        return next((matches[0] for matches in self._scan(canonical)), None)
+
+    def find_all(self, canonical: str) -> List[str]:
+        return list(dict.fromkeys(p for matches in self._scan(canonical) for p in matches))
+
+    @property
+    def size(self) -> int:
+        return len(self.goto)
+
+
+def ngrams(text: str, n: int = 3) -> FrozenSet[str]:
+    padded = f"  {text} "
+    return frozenset(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+
+class FuzzyMatcher:
+    def __init__(self, phrases: Iterable[str], n: int = 3):
+        self.n = n
+        self.phrases = list(dict.fromkeys(phrases))
+        self.grams = [ngrams(phrase, n) for phrase in self.phrases]
+        self.postings: Dict[str, List[int]] = {}
+        for phrase_id, grams in enumerate(self.grams):
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(phrase_id)
+
+    def best(self, text: str) -> Tuple[Optional[str], float]:
+        grams = ngrams(text, self.n)
+        overlaps: Dict[int, int] = {}
+        for gram in grams:
+            for phrase_id in self.postings.get(gram, ()):
+                overlaps[phrase_id] = overlaps.get(phrase_id, 0) + 1
+        best_id, best_score = None, 0.0
+        for phrase_id, overlap in overlaps.items():
+            score = 2 * overlap / (len(grams) + len(self.grams[phrase_id]))
+            if score > best_score:
+                best_id, best_score = phrase_id, score
+        return (self.phrases[best_id] if best_id is not None else None), best_score
+
+
+@dataclass(frozen=True)
+class QueryRoute:
+    kind: str
+    normalized: str
+    reply: Optional[str] = None
+    matched: Optional[str] = None
+    score: float = 0.0
+    is_follow_up: bool = False
+
+
+class QueryRouter:
+    def __init__(self, version: str, quick_responses: Mapping[str, str], keywords: Iterable[str],
+                 fuzzy_threshold: float = 0.8):
+        self.version = version
+        self.fuzzy_threshold = fuzzy_threshold
+        self.quick: Dict[str, str] = {}
+        for question, reply in quick_responses.items():
+            self.quick.setdefault(normalize_query(question), reply)
+        self.keywords = KeywordMatcher(keywords)
+        self.fuzzy = FuzzyMatcher(self.quick)
+        self.terms = {question: frozenset(tokenize(question)) for question in self.quick}
+        self.counts = {kind: 0 for kind in (QUICK, CACHED, REFUSE, LLM)}
+
+    def route(self, user_input: str, peek_cached: Optional[Callable[[str], Optional[str]]] = None) -> QueryRoute:
+        normalized = normalize_query(user_input)
+        route = self._classify(normalized, peek_cached)
+        self.counts[route.kind] += 1
+        return route
+
+    def _classify(self, normalized: str, peek_cached: Optional[Callable[[str], Optional[str]]]) -> QueryRoute:
+        if reply := self.quick.get(normalized):
+            return QueryRoute(QUICK, normalized, reply, normalized, 1.0)
+        matched, score = self.fuzzy.best(normalized)
+        if matched and score >= self.fuzzy_threshold and self.terms[matched].issuperset(tokenize(normalized)):
+            return QueryRoute(QUICK, normalized, self.quick[matched], matched, round(score, 4))
+        is_follow_up = is_follow_up_query(normalized)
+        keyword = normalized if normalized in GREETINGS else self.keywords.search(normalized)
+        if keyword is None:
+            return QueryRoute(REFUSE, normalized, is_follow_up=is_follow_up)
+        if not is_follow_up and peek_cached:
+            if reply := peek_cached(global_reply_key(normalized, self.version)):
+                return QueryRoute(CACHED, normalized, reply, keyword)
+        return QueryRoute(LLM, normalized, matched=keyword, is_follow_up=is_follow_up)
+
+    @property
+    def stats(self) -> Dict:
+        return {
+            "version": self.version,
+            "quick_phrases": len(self.quick),
+            "keyword_states": self.keywords.size,
+            "routes": dict(self.counts)
+        }
+
+
+def get_entity_names() -> List[str]:
+    snapshot = get_content_snapshot()
+    names = [snapshot.get("user_profile", {}).get("name", "")]
+    for collection, field in ENTITY_FIELDS.items():
+        names.extend(str(getattr(item, field, "") or "") for item in snapshot.items(collection))
+    return [name for name in names if name]
+
+
+def build_query_router(version: Optional[str] = None,
+                       quick_responses: Optional[Mapping[str, str]] = None) -> QueryRouter:
+    allowed_keywords = get_ai_config().get("allowed_keywords", ["krishna", "verma"])
+    keywords = list(dict.fromkeys([*allowed_keywords, *get_entity_names()]))
+    return QueryRouter(
+        version or get_content_version(),
+        load_quick_responses() if quick_responses is None else quick_responses,
+        keywords,
+        fuzzy_threshold=Config.QUERY_FUZZY_THRESHOLD
+    )
+
+
+_router: Optional[QueryRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_query_router(quick_responses: Optional[Mapping[str, str]] = None) -> QueryRouter:
+    global _router
+    version = get_content_version()
+    router = _router
+    if router is not None and router.version == version:
+        return router
+    with _router_lock:
+        if _router is None or _router.version != version:
+            _router = build_query_router(version, quick_responses)
+            logger.info(
+                f"✅ Query Router Compiled ({len(_router.quick)} Phrases, {_router.keywords.size} States)")
+        return _router
@@ -1,18 +1,51 @@
 import logging
 import time
 import hashlib
-from typing import Tuple, Optional
-from .assistant_logic import AssistantCoreLogic, is_query_relevant
+from dataclasses import dataclass
+from typing import Dict, Generator, Iterator, Tuple, Optional
+from .assistant_logic import AssistantCoreLogic
+from .assistant_models import model_router
+from .assistant_query import (
+    QueryRoute, QueryRouter, get_query_router, global_reply_key, QUICK, CACHED, REFUSE
+)
 from .assistant_response import log_assistant_response
+from .assistant_state import ConversationState
+from ..cache import single_flight
+from ..config import Config
 from ..db.data import (
-    log_conversation, get_chat_history,
     get_cached_ai_response, set_cached_ai_response,
     search_database
 )
+from ..db.search import SearchHit
 
 logger = logging.getLogger(__name__)
 
 
+SEARCH_LABELS = {
+    "projects": "Project", "blog_posts": "Blog", "skills": "Skill",
+    "certifications": "Certification", "services": "Service"
+}
+
+
+def _format_hit(hit: SearchHit) -> str:
+    label = SEARCH_LABELS.get(hit.collection)
+    if not label:
+        return f"• {hit.snippet}"
+    return f"• **{hit.title}** ({label}): {hit.snippet}" if hit.snippet else f"• **{hit.title}** ({label})"
+
+
+class StreamInterrupted(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ReplyPlan:
+    cache_key: str
+    use_history: bool
+    is_duplicate: bool
+    state: ConversationState
+
+
 class AssistantService:
     def __init__(self):
         self.logic = AssistantCoreLogic()
@@ -23,78 +56,173 @@ class AssistantService:
             return "offline"
         return "online" if getattr(self.logic, 'is_online', False) else "database"
 
+    @property
+    def router(self) -> QueryRouter:
+        return get_query_router(self.logic.quick_responses)
+
+    @property
+    def route_stats(self) -> Dict:
+        return self.router.stats
+
     def get_response(self, user_input: str, session_id: str = "default", silent: bool = False) -> dict:
-        clean_input = user_input.strip().lower().replace("?", "").replace(".", "")
-        is_duplicate = self._is_duplicate_query(session_id, clean_input)
-        if clean_input in self.logic.quick_responses:
-            return self._handle_quick_response(
-                user_input, clean_input, session_id, is_duplicate, silent
+        result, plan = self._prepare(user_input, session_id, silent)
+        if result:
+            return result
+        if self.logic.is_online:
+            reply, used_model = single_flight.do(
+                f"reply:{plan.cache_key}",
+                lambda: self._generate_and_store(user_input, plan),
+                lookup=lambda: self._lookup_shared_reply(plan),
+                lease_seconds=Config.SINGLE_FLIGHT_LEASE
             )
-        cache_key = hashlib.sha256(
-            f"ai_reply_{session_id}_{clean_input}".encode()).hexdigest()
-        cached_reply = get_cached_ai_response(cache_key)
-        if cached_reply:
+            if reply:
+                return self._handle_online_response(
+                    user_input, reply, used_model, plan, silent)
+        return self._fallback_search(user_input, silent)
+
+    def stream_response(self, user_input: str, session_id: str = "default", silent: bool = False) -> Iterator[dict]:
+        result, plan = self._prepare(user_input, session_id, silent)
+        if result:
+            yield result
+            return
+        if self.logic.is_online:
+            try:
+                shared = yield from single_flight.stream(
+                    f"reply:{plan.cache_key}",
+                    lambda: self._stream_and_store(user_input, plan),
+                    lookup=lambda: self._lookup_shared_reply(plan),
+                    lease_seconds=Config.SINGLE_FLIGHT_LEASE
+                )
+            except StreamInterrupted as e:
+                if not silent:
+                    log_assistant_response(logger, "offline", f"Stream Interrupted on {e}")
+                yield {"error": "Stream Interrupted", "status": "offline"}
+                return
+            if shared:
+                reply, used_model = shared
+                yield self._handle_online_response(
+                    user_input, reply, used_model, plan, silent)
+                return
+        yield self._fallback_search(user_input, silent)
+
+    def _prepare(self, user_input: str, session_id: str, silent: bool) -> Tuple[Optional[dict], Optional[ReplyPlan]]:
+        route = self.router.route(user_input, peek_cached=get_cached_ai_response)
+        if route.kind in (QUICK, CACHED):
+            state = ConversationState.load(session_id)
+            is_duplicate = state.is_duplicate(route.normalized)
+            if route.kind == QUICK:
+                return self._handle_quick_response(
+                    user_input, route, state, is_duplicate, silent
+                ), None
             return self._handle_cached_response(
-                user_input, cached_reply, session_id, is_duplicate, silent
-            )
-        if not is_query_relevant(user_input, self.logic.ai_config):
+                user_input, route.reply, state, is_duplicate, silent
+            ), None
+        if route.kind == REFUSE:
             if not silent:
                 log_assistant_response(logger, "refused", "Refused Query")
-            return {"reply": "I cannot Assist with that Request.", "status": "refused"}
-        if self.logic.is_online:
-            reply, used_model = self._generate_with_retries(
-                user_input, session_id)
-            if reply:
-                set_cached_ai_response(cache_key, reply)
-                if not is_duplicate:
-                    log_conversation(session_id, user_input, reply)
-                if not silent:
-                    log_assistant_response(logger, "online", used_model)
-                return {"reply": reply, "status": "online"}
-        return self._fallback_search(user_input, silent)
+            return {"reply": "I cannot Assist with that Request.", "status": "refused"}, None
+        state = ConversationState.load(session_id)
+        is_duplicate = state.is_duplicate(route.normalized)
+        use_history = state.has_history and route.is_follow_up
+        cache_key = self._reply_cache_key(route.normalized, session_id, use_history)
+        cached_reply = state.cached(cache_key) if route.is_follow_up else None
+        if cached_reply:
+            return self._handle_cached_response(
+                user_input, cached_reply, state, is_duplicate, silent
+            ), None
+        return None, ReplyPlan(cache_key, use_history, is_duplicate, state)
 
-    def _is_duplicate_query(self, session_id: str, clean_input: str) -> bool:
-        recent_history = get_chat_history(session_id, limit=1)
-        return bool(recent_history and recent_history[0].user_query.strip().lower() == clean_input)
+    @staticmethod
+    def _reply_cache_key(normalized: str, session_id: str, use_history: bool) -> str:
+        if use_history:
+            raw_key = f"ai_reply_{session_id}_{normalized}"
+            return hashlib.sha256(raw_key.encode()).hexdigest()
+        return global_reply_key(normalized)
 
-    def _handle_quick_response(self, user_input: str, clean_input: str, session_id: str, is_duplicate: bool, silent: bool) -> dict:
-        reply = self.logic.quick_responses[clean_input]
+    def _handle_quick_response(self, user_input: str, route: QueryRoute, state: ConversationState, is_duplicate: bool, silent: bool) -> dict:
+        reply = route.reply
         if not silent:
             log_assistant_response(logger, "cached_mode",
                                    "Quick Response")
         if not is_duplicate:
-            log_conversation(session_id, user_input, reply)
+            state.record(user_input, reply)
         return {"reply": reply, "status": "cached_mode"}
 
-    def _handle_cached_response(self, user_input: str, cached_reply: str, session_id: str, is_duplicate: bool, silent: bool) -> dict:
+    def _generate_and_store(self, user_input: str, plan: ReplyPlan) -> Tuple[Optional[str], Optional[str]]:
+        reply, used_model = self._generate_with_retries(user_input, plan)
+        if reply:
+            set_cached_ai_response(plan.cache_key, reply)
+        return reply, used_model
+
+    def _stream_and_store(self, user_input: str, plan: ReplyPlan) -> Generator[dict, None, Optional[Tuple[str, str]]]:
+        chunks, used_model = [], None
+        for used_model, text in self._stream_with_fallback(user_input, plan):
+            chunks.append(text)
+            yield {"delta": text}
+        reply = "".join(chunks).strip()
+        if not reply:
+            return None
+        set_cached_ai_response(plan.cache_key, reply)
+        return reply, used_model
+
+    @staticmethod
+    def _lookup_shared_reply(plan: ReplyPlan) -> Optional[Tuple[str, str]]:
+        reply = get_cached_ai_response(plan.cache_key, refresh=True)
+        return (reply, "Shared Reply") if reply else None
+
+    def _handle_online_response(self, user_input: str, reply: str, used_model: Optional[str], plan: ReplyPlan, silent: bool) -> dict:
+        if not plan.is_duplicate:
+            plan.state.record(user_input, reply)
+        if not silent:
+            log_assistant_response(logger, "online", used_model)
+        return {"reply": reply, "status": "online"}
+
+    def _handle_cached_response(self, user_input: str, cached_reply: str, state: ConversationState, is_duplicate: bool, silent: bool) -> dict:
         if not silent:
             log_assistant_response(logger, "cached_mode",
                                    "Cache Response")
         if not is_duplicate:
-            log_conversation(session_id, user_input, cached_reply)
+            state.record(user_input, cached_reply)
         return {"reply": cached_reply, "status": "cached_mode"}
 
-    def _generate_with_retries(self, user_input: str, session_id: str) -> Tuple[Optional[str], Optional[str]]:
-        instructions = self.logic.build_instructions()
-        history = self.logic.format_history(session_id)
-        for model_name in self.logic.model_stack:
-            max_retries = 3
-            backoff_time = 0.3
-            for attempt in range(max_retries):
-                try:
-                    reply = self.logic.generate_content(
-                        model_name, instructions, history, user_input)
-                    if reply:
-                        return reply, model_name
-                    raise ValueError("Empty Response from Model")
-                except Exception as e:
-                    error_msg = str(e)
-                    if ("429" in error_msg or "503" in error_msg or "RESOURCE_EXHAUSTED" in error_msg) and attempt < max_retries - 1:
-                        time.sleep(backoff_time)
-                        backoff_time *= 2
-                    else:
-                        break
-        return None, None
+    @staticmethod
+    def _retrieval_query(user_input: str, plan: ReplyPlan) -> str:
+        if not plan.use_history:
+            return user_input
+        return " ".join([entry.user_query for entry in plan.state.history[-2:]] + [user_input])
+
+    def _generate_with_retries(self, user_input: str, plan: ReplyPlan) -> Tuple[Optional[str], Optional[str]]:
+        instructions = self.logic.build_instructions(self._retrieval_query(user_input, plan))
+        history = self.logic.format_history(
+            plan.state.history) if plan.use_history else []
+        return model_router.call(
+            self.logic.model_stack,
+            lambda model_name: self.logic.generate_content(
+                model_name, instructions, history, user_input)
+        )
+
+    def _stream_with_fallback(self, user_input: str, plan: ReplyPlan) -> Iterator[Tuple[str, str]]:
+        instructions = self.logic.build_instructions(self._retrieval_query(user_input, plan))
+        history = self.logic.format_history(
+            plan.state.history) if plan.use_history else []
+        for model_name in model_router.candidates(self.logic.model_stack):
+            started = False
+            begin = time.perf_counter()
+            try:
+                for text in self.logic.stream_content(model_name, instructions, history, user_input):
+                    if text:
+                        started = True
+                        yield model_name, text
+                if started:
+                    model_router.record_success(
+                        model_name, time.perf_counter() - begin)
+                    return
+                raise ValueError("Empty Response from Model")
+            except Exception as e:
+                model_router.record_failure(model_name, e)
+                if started:
+                    logger.warning(f"⚠️ Stream Interrupted on {model_name}: {e}")
+                    raise StreamInterrupted(model_name) from e
 
     def _fallback_search(self, query: str, silent: bool = False) -> dict:
         matches = search_database(query)
@@ -102,7 +230,7 @@ class AssistantService:
             if not silent:
                 log_assistant_response(
                     logger, "database_mode", f"Data Base Mode: {len(matches)}")
-            return {"reply": "\n".join([f"• {m.info}" for m in matches]), "status": "database_mode"}
+            return {"reply": "\n".join(_format_hit(m) for m in matches), "status": "database_mode"}
         if not silent:
             log_assistant_response(
                 logger, "offline", "Offline Mode")
@@ -0,0 +1,100 @@
+import time
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+from ..config import Config
+from ..db.data import get_chat_history, get_cached_ai_responses, log_conversation
+from .assistant_logic import normalize_query
+
+HISTORY_LIMIT = 10
+
+
+class SessionHistoryBuffer:
+    def __init__(self, max_sessions: int = 1000, max_turns: int = HISTORY_LIMIT, ttl: float = 300.0):
+        self.max_sessions = max_sessions
+        self.max_turns = max_turns
+        self.ttl = ttl
+        self._sessions: "OrderedDict[str, Tuple[Deque[SimpleNamespace], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[List[SimpleNamespace]]:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            turns, loaded_at = entry
+            if time.monotonic() - loaded_at > self.ttl:
+                del self._sessions[session_id]
+                return None
+            self._sessions.move_to_end(session_id)
+            return list(turns)
+
+    def load(self, session_id: str, turns: Iterable[SimpleNamespace]) -> None:
+        with self._lock:
+            self._sessions[session_id] = (
+                deque(turns, maxlen=self.max_turns), time.monotonic())
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def append(self, session_id: str, turn: SimpleNamespace) -> None:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is not None:
+                entry[0].append(turn)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+
+history_buffer = SessionHistoryBuffer(
+    max_sessions=Config.SESSION_BUFFER_MAX_SESSIONS, ttl=Config.SESSION_BUFFER_TTL)
+
+
+class ConversationState:
+    def __init__(self, session_id: str, history: List[SimpleNamespace]):
+        self.session_id = session_id
+        self.history = history
+        self._cache: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, session_id: str) -> "ConversationState":
+        history = history_buffer.get(session_id)
+        if history is None:
+            history = get_chat_history(session_id, limit=HISTORY_LIMIT)
+            history_buffer.load(session_id, history)
+        return cls(session_id, history)
+
+    @property
+    def has_history(self) -> bool:
+        return bool(self.history)
+
+    @property
+    def last_query(self) -> Optional[str]:
+        return self.history[-1].user_query if self.history else None
+
+    def is_duplicate(self, normalized: str) -> bool:
+        return bool(self.last_query and normalize_query(self.last_query) == normalized)
+
+    def prefetch(self, *cache_keys: str) -> None:
+        missing = [key for key in cache_keys if key not in self._cache]
+        if missing:
+            self._cache.update(get_cached_ai_responses(missing))
+
+    def cached(self, cache_key: str) -> Optional[str]:
+        self.prefetch(cache_key)
+        return self._cache.get(cache_key)
+
+    def record(self, user_input: str, reply: str) -> None:
+        log_conversation(self.session_id, user_input, reply)
+        turn = SimpleNamespace(
+            session_id=self.session_id,
+            user_query=user_input,
+            bot_response=reply,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+        self.history.append(turn)
+        history_buffer.append(self.session_id, turn)
@@ -0,0 +1,4 @@
+from .cache import MemoryCache, NOT_FOUND, estimate_size
+from .cache_compress import ResponseCompressor, response_compressor, compress_response, etag_variants
+from .cache_page import PageCache, CachedPage, page_cache, cached_page
+from .cache_flight import SingleFlight, single_flight, get_lease_owner
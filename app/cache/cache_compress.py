@@ -0,0 +1,120 @@
+import gzip
+import logging
+from typing import Any, Dict, List, Optional
+from flask import Response, request
+from ..config import Config
+from .cache import MemoryCache
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_TYPES = frozenset({
+    "application/json", "application/javascript", "application/xml",
+    "application/manifest+json", "image/svg+xml"
+})
+ENCODINGS = ("br", "gzip")
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def etag_variants(etag: str) -> List[str]:
+    return [etag] + [f"{etag}-{encoding}" for encoding in ENCODINGS]
+
+
+class ResponseCompressor:
+    def __init__(self, min_size: int = 512, max_entries: int = 256, max_bytes: int = 8 * 1024 * 1024,
+                 gzip_level: int = 6, brotli_quality: int = 5, cached_brotli_quality: int = 9):
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cached_brotli_quality = cached_brotli_quality
+        self.store = MemoryCache("compressed", max_entries=max_entries, max_bytes=max_bytes)
+        self.encodings = tuple(e for e in ENCODINGS if e != "br" or brotli is not None)
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @staticmethod
+    def is_compressible(response: Response) -> bool:
+        mimetype = response.mimetype or ""
+        return mimetype.startswith("text/") and mimetype != "text/event-stream" or mimetype in COMPRESSIBLE_TYPES
+
+    def choose_encoding(self) -> Optional[str]:
+        return request.accept_encodings.best_match(self.encodings)
+
+    def encode(self, body: bytes, encoding: str, cached: bool = False) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.cached_brotli_quality if cached else self.brotli_quality)
+        return gzip.compress(body, compresslevel=9 if cached else self.gzip_level, mtime=0)
+
+    def compress(self, response: Response) -> Response:
+        if response.is_streamed or response.direct_passthrough or "Content-Encoding" in response.headers:
+            return response
+        if response.status_code == 304:
+            return self._tag_not_modified(response)
+        if response.status_code != 200 or not self.is_compressible(response):
+            return response
+        response.vary.add("Accept-Encoding")
+        body = response.get_data()
+        encoding = self.choose_encoding() if len(body) >= self.min_size else None
+        if not encoding:
+            return response
+        etag, weak = response.get_etag()
+        compressed = self._get_compressed(body, encoding, None if weak else etag)
+        if len(compressed) >= len(body):
+            return response
+        self.bytes_in += len(body)
+        self.bytes_out += len(compressed)
+        response.set_data(compressed)
+        response.content_encoding = encoding
+        if etag:
+            response.set_etag(f"{etag}-{encoding}", weak=weak)
+        return response
+
+    def _get_compressed(self, body: bytes, encoding: str, etag: Optional[str]) -> bytes:
+        if not etag:
+            return self.encode(body, encoding)
+        key = (etag, encoding)
+        compressed = self.store.get(key)
+        if compressed is None:
+            compressed = self.encode(body, encoding, cached=True)
+            self.store.set(key, compressed, size=len(compressed))
+        return compressed
+
+    def _tag_not_modified(self, response: Response) -> Response:
+        etag, weak = response.get_etag()
+        encoding = self.choose_encoding()
+        if etag and encoding and request.if_none_match.contains_weak(f"{etag}-{encoding}"):
+            response.set_etag(f"{etag}-{encoding}", weak=weak)
+            response.vary.add("Accept-Encoding")
+        return response
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.store.stats,
+            "encodings": list(self.encodings),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.bytes_out / self.bytes_in, 4) if self.bytes_in else 0.0
+        }
+
+
+response_compressor = ResponseCompressor(
+    min_size=Config.COMPRESS_MIN_SIZE,
+    max_entries=Config.COMPRESS_CACHE_MAX_ENTRIES,
+    max_bytes=Config.COMPRESS_CACHE_MAX_BYTES,
+    gzip_level=Config.COMPRESS_GZIP_LEVEL,
+    brotli_quality=Config.COMPRESS_BROTLI_QUALITY
+)
+
+
+def compress_response(response: Response) -> Response:
+    if not Config.COMPRESS_ENABLED:
+        return response
+    try:
+        return response_compressor.compress(response)
+    except Exception as e:
+        logger.error(f"❌ Response Compression Failed - {e}")
+        return response
@@ -0,0 +1,163 @@
+import os
+import time
+import uuid
+import socket
+import logging
+import threading
+from typing import Any, Callable, Dict, Generator, Optional, Tuple
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+_INSTANCE_ID = uuid.uuid4().hex[:8]
+
+
+def get_lease_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{_INSTANCE_ID}"
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.aborted = False
+
+
+class SingleFlight:
+    def __init__(self, poll_interval: float = 0.25):
+        self.poll_interval = poll_interval
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any], lookup: Optional[Callable[[], Any]] = None,
+           lease_seconds: Optional[float] = None, wait_seconds: Optional[float] = None) -> Any:
+        wait_seconds = Config.SINGLE_FLIGHT_WAIT if wait_seconds is None else wait_seconds
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+        if not is_leader:
+            if not call.done.wait(wait_seconds):
+                logger.warning(f"⚠️ Single-Flight Wait Timed Out: {key}")
+                return fn()
+            if call.error:
+                raise call.error
+            return call.result
+        try:
+            call.result = self._lead(key, fn, lookup, lease_seconds, wait_seconds)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def stream(self, key: str, fn: Callable[[], Generator[Any, None, Any]],
+               lookup: Optional[Callable[[], Any]] = None, lease_seconds: Optional[float] = None,
+               wait_seconds: Optional[float] = None) -> Generator[Any, None, Any]:
+        wait_seconds = Config.SINGLE_FLIGHT_WAIT if wait_seconds is None else wait_seconds
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+        if not is_leader:
+            if not call.done.wait(wait_seconds):
+                logger.warning(f"⚠️ Single-Flight Wait Timed Out: {key}")
+                return (yield from fn())
+            if call.aborted:
+                return (yield from fn())
+            if call.error:
+                raise call.error
+            return call.result
+        try:
+            call.result = yield from self._lead_stream(key, fn, lookup, lease_seconds, wait_seconds)
+            return call.result
+        except GeneratorExit:
+            call.aborted = True
+            raise
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def _lead(self, key: str, fn: Callable[[], Any], lookup: Optional[Callable[[], Any]],
+              lease_seconds: Optional[float], wait_seconds: float) -> Any:
+        if lookup is None or not lease_seconds:
+            return fn()
+        owner = get_lease_owner()
+        acquired, result = self._await_lease(key, owner, lookup, lease_seconds, wait_seconds)
+        if not acquired:
+            return fn() if result is None else result
+        try:
+            result = fn()
+            self._flush_writes(key, lease_seconds)
+            return result
+        finally:
+            self._release(key, owner)
+
+    def _lead_stream(self, key: str, fn: Callable[[], Generator[Any, None, Any]],
+                     lookup: Optional[Callable[[], Any]], lease_seconds: Optional[float],
+                     wait_seconds: float) -> Generator[Any, None, Any]:
+        if lookup is None or not lease_seconds:
+            return (yield from fn())
+        owner = get_lease_owner()
+        acquired, result = self._await_lease(key, owner, lookup, lease_seconds, wait_seconds)
+        if not acquired:
+            return (yield from fn()) if result is None else result
+        try:
+            result = yield from fn()
+            self._flush_writes(key, lease_seconds)
+            return result
+        finally:
+            self._release(key, owner)
+
+    def _await_lease(self, key: str, owner: str, lookup: Callable[[], Any], lease_seconds: float,
+                     wait_seconds: float) -> Tuple[bool, Any]:
+        from ..db.data import acquire_lease
+        lease_key = f"flight:{key}"
+        deadline = time.monotonic() + wait_seconds
+        waited = False
+        while not acquire_lease(lease_key, owner, lease_seconds, fail_open=True):
+            waited = True
+            if time.monotonic() >= deadline:
+                logger.warning(f"⚠️ Lease Wait Timed Out: {key}")
+                return False, None
+            time.sleep(self.poll_interval)
+            result = lookup()
+            if result is not None:
+                return False, result
+        if waited and (result := lookup()) is not None:
+            self._release(key, owner)
+            return False, result
+        return True, None
+
+    @staticmethod
+    def _flush_writes(key: str, timeout: float) -> None:
+        from ..db.writer import batch_writer
+        if not batch_writer.flush(timeout):
+            logger.warning(f"⚠️ Write Flush Timed Out Before Lease Release: {key}")
+
+    @staticmethod
+    def _release(key: str, owner: str) -> None:
+        from ..db.data import release_lease
+        release_lease(f"flight:{key}", owner)
+
+    def reset(self) -> None:
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,101 @@
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Callable, Hashable, Optional
+from flask import Response, current_app, request
+from ..config import Config
+from ..db.content import get_content_version
+from .cache import MemoryCache
+from .cache_compress import etag_variants
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    body: bytes
+    etag: str
+    last_modified: datetime
+    mimetype: str
+
+
+class PageCache:
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.store = MemoryCache("pages", max_entries=max_entries, max_bytes=max_bytes)
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _sync_version(self) -> str:
+        version = get_content_version()
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    if self._version is not None:
+                        logger.info("✅ Page Cache Invalidated by Content Change")
+                    self.store.clear()
+                    self._version = version
+        return version
+
+    def get_or_render(self, key: Hashable, render: Callable[[], Response]) -> Response:
+        full_key = (self._sync_version(), key)
+        page: Optional[CachedPage] = self.store.get(full_key)
+        if page is None:
+            response = render()
+            if response.status_code != 200 or response.is_streamed or response.direct_passthrough:
+                return response
+            body = response.get_data()
+            page = CachedPage(
+                body=body,
+                etag=hashlib.sha256(body).hexdigest()[:32],
+                last_modified=datetime.now(timezone.utc).replace(microsecond=0),
+                mimetype=response.mimetype
+            )
+            self.store.set(full_key, page, size=len(body))
+        return self._respond(page)
+
+    @staticmethod
+    def _is_not_modified(page: CachedPage) -> bool:
+        if request.if_none_match:
+            return any(request.if_none_match.contains(etag) for etag in etag_variants(page.etag))
+        if request.if_modified_since:
+            return page.last_modified <= request.if_modified_since
+        return False
+
+    def _respond(self, page: CachedPage) -> Response:
+        if self._is_not_modified(page):
+            response = Response(status=304)
+        else:
+            response = Response(page.body, mimetype=page.mimetype)
+        response.set_etag(page.etag)
+        response.last_modified = page.last_modified
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        return response
+
+
+page_cache = PageCache(Config.PAGE_CACHE_MAX_ENTRIES, Config.PAGE_CACHE_MAX_BYTES)
+
+
+def _page_key() -> Hashable:
+    from ..assets import asset_manifest
+    assistant = getattr(current_app, 'assistant', None)
+    return (
+        asset_manifest.fingerprint,
+        request.endpoint,
+        tuple(sorted((request.view_args or {}).items())),
+        assistant.status if assistant else "offline",
+        datetime.now().year
+    )
+
+
+def cached_page(view: Callable) -> Callable:
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if request.method not in ("GET", "HEAD") or current_app.debug or not current_app.config.get("PAGE_CACHE_ENABLED", True):
+            return view(*args, **kwargs)
+        return page_cache.get_or_render(
+            _page_key(), lambda: current_app.make_response(view(*args, **kwargs)))
+    return wrapper
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 from dotenv import load_dotenv
 from ..utils import format_postgres_url, get_secret_key, get_bool_env
@@ -14,11 +15,76 @@ class Config:
     GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-pro")
     GITHUB_USERNAME = os.getenv("GITHUB_USERNAME")
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+    GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+    GITHUB_CACHE_TTL = int(os.getenv("GITHUB_CACHE_TTL", "3600"))
+    GITHUB_RETRY_SECONDS = int(os.getenv("GITHUB_RETRY_SECONDS", "300"))
+    GITHUB_PER_PAGE = int(os.getenv("GITHUB_PER_PAGE", "100"))
+    GITHUB_MAX_PAGES = int(os.getenv("GITHUB_MAX_PAGES", "10"))
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "8"))
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+    HTTP_TIME_BUDGET = float(os.getenv("HTTP_TIME_BUDGET", "15"))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+    HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
     LINKEDIN_USERNAME = os.getenv("LINKEDIN_USERNAME")
     HOST = os.getenv("HOST")
     PORT = int(os.getenv("PORT"))
     IS_RENDER = get_bool_env("RENDER")
     USE_SQLITE_LOCALLY = get_bool_env("USE_SQLITE_LOCALLY")
+    CONTENT_RELOAD_INTERVAL = float(os.getenv("CONTENT_RELOAD_INTERVAL", "2"))
+    REDIS_URL = os.getenv("REDIS_URL")
+    RATE_LIMIT_DB_PATH = os.getenv("RATE_LIMIT_DB_PATH", os.path.join(tempfile.gettempdir(), "portfolio_rate_limits.db"))
+    PAGE_CACHE_ENABLED = get_bool_env("PAGE_CACHE_ENABLED", "True")
+    PAGE_CACHE_MAX_ENTRIES = int(os.getenv("PAGE_CACHE_MAX_ENTRIES", "256"))
+    PAGE_CACHE_MAX_BYTES = int(os.getenv("PAGE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    COMPRESS_ENABLED = get_bool_env("COMPRESS_ENABLED", "True")
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "512"))
+    COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", "6"))
+    COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", "5"))
+    COMPRESS_CACHE_MAX_ENTRIES = int(os.getenv("COMPRESS_CACHE_MAX_ENTRIES", "256"))
+    COMPRESS_CACHE_MAX_BYTES = int(os.getenv("COMPRESS_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+    MARKDOWN_CACHE_SIZE = int(os.getenv("MARKDOWN_CACHE_SIZE", "128"))
+    MARKDOWN_WARMUP = get_bool_env("MARKDOWN_WARMUP", "True")
+    L1_CACHE_MAX_ENTRIES = int(os.getenv("L1_CACHE_MAX_ENTRIES", "2048"))
+    L1_CACHE_MAX_BYTES = int(os.getenv("L1_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+    L1_CACHE_TTL = float(os.getenv("L1_CACHE_TTL", "300"))
+    L1_NEGATIVE_TTL = float(os.getenv("L1_NEGATIVE_TTL", "30"))
+    SINGLE_FLIGHT_WAIT = float(os.getenv("SINGLE_FLIGHT_WAIT", "30"))
+    SINGLE_FLIGHT_LEASE = float(os.getenv("SINGLE_FLIGHT_LEASE", "60"))
+    DB_WRITE_BEHIND = get_bool_env("DB_WRITE_BEHIND", "True")
+    DB_WRITE_BATCH_SIZE = int(os.getenv("DB_WRITE_BATCH_SIZE", "50"))
+    DB_WRITE_FLUSH_MS = int(os.getenv("DB_WRITE_FLUSH_MS", "200"))
+    DB_WRITE_QUEUE_SIZE = int(os.getenv("DB_WRITE_QUEUE_SIZE", "2000"))
+    DB_WRITE_OVERFLOW = os.getenv("DB_WRITE_OVERFLOW", "drop").lower()
+    CONTACT_ASYNC_WRITE = get_bool_env("CONTACT_ASYNC_WRITE")
+    SESSION_BUFFER_MAX_SESSIONS = int(os.getenv("SESSION_BUFFER_MAX_SESSIONS", "1000"))
+    SESSION_BUFFER_TTL = float(os.getenv("SESSION_BUFFER_TTL", "300"))
+    GEMINI_HEDGE_AFTER_MS = int(os.getenv("GEMINI_HEDGE_AFTER_MS", "0"))
+    MODEL_FAILURE_THRESHOLD = int(os.getenv("MODEL_FAILURE_THRESHOLD", "3"))
+    MODEL_COOLDOWN_SECONDS = float(os.getenv("MODEL_COOLDOWN_SECONDS", "30"))
+    MODEL_RATE_LIMIT_COOLDOWN = float(os.getenv("MODEL_RATE_LIMIT_COOLDOWN", "60"))
+    SEARCH_TOP_K = int(os.getenv("SEARCH_TOP_K", "3"))
+    PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "6000"))
+    PROMPT_RETRIEVAL = get_bool_env("PROMPT_RETRIEVAL", "True")
+    PROMPT_RETRIEVAL_BUDGET = int(os.getenv("PROMPT_RETRIEVAL_BUDGET", "1200"))
+    PROMPT_RETRIEVAL_TOP_K = int(os.getenv("PROMPT_RETRIEVAL_TOP_K", "8"))
+    PROMPT_CHUNK_TOKENS = int(os.getenv("PROMPT_CHUNK_TOKENS", "120"))
+    QUERY_FUZZY_THRESHOLD = float(os.getenv("QUERY_FUZZY_THRESHOLD", "0.8"))
+    ASSETS_AUTO_BUILD = get_bool_env("ASSETS_AUTO_BUILD", "True")
+    ASSETS_BUILD_LEASE = float(os.getenv("ASSETS_BUILD_LEASE", "180"))
+    PRELOAD_APP = get_bool_env("PRELOAD_APP")
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "sql").lower()
+    CACHE_FILE_DIR = os.getenv("CACHE_FILE_DIR", os.path.join(tempfile.gettempdir(), "portfolio_cache"))
+    AI_CACHE_TTL_HOURS = int(os.getenv("AI_CACHE_TTL_HOURS", "24"))
+    GITHUB_CACHE_RETENTION_DAYS = int(os.getenv("GITHUB_CACHE_RETENTION_DAYS", "30"))
+    CHAT_RETENTION_DAYS = int(os.getenv("CHAT_RETENTION_DAYS", "90"))
+    PRUNE_BATCH_SIZE = int(os.getenv("PRUNE_BATCH_SIZE", "500"))
+    PRUNE_MAX_BATCHES = int(os.getenv("PRUNE_MAX_BATCHES", "20"))
+    SCHEDULER_ENABLED = get_bool_env("SCHEDULER_ENABLED", "True")
+    SCHEDULER_GITHUB_INTERVAL = float(os.getenv("SCHEDULER_GITHUB_INTERVAL", "900"))
+    SCHEDULER_MODELS_INTERVAL = float(os.getenv("SCHEDULER_MODELS_INTERVAL", "10800"))
+    SCHEDULER_CONTEXT_INTERVAL = float(os.getenv("SCHEDULER_CONTEXT_INTERVAL", "1800"))
+    SCHEDULER_PRUNE_INTERVAL = float(os.getenv("SCHEDULER_PRUNE_INTERVAL", "3600"))
+    SCHEDULER_SYNC_INTERVAL = float(os.getenv("SCHEDULER_SYNC_INTERVAL", "300"))
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
 
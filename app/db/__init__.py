@@ -7,7 +7,23 @@ from .data import (
     get_all_certifications, get_all_skills, get_all_database,
     search_database, get_core_principles, get_core_philosophy,
     save_contact_message, log_conversation, get_chat_history,
-    get_cached_ai_response, set_cached_ai_response,
-    get_cached_github_data, set_cached_github_data,
-    get_cached_valid_models, set_cached_valid_models, CacheKeys
+    get_cached_ai_response, get_cached_ai_responses, set_cached_ai_response,
+    get_cached_github_data, set_cached_github_data, get_github_snapshot,
+    get_cached_valid_models, set_cached_valid_models, CacheKeys,
+    get_item_by_slug, get_cache_stats, acquire_lease, release_lease
+)
+from .migrations import Migration, MIGRATIONS, run_migrations, get_applied_versions
+from .retention import prune_database, prune_table, get_cache_retention
+from .store import (
+    CacheBackend, CacheEntry, SQLCacheBackend, MemoryCacheBackend, FileCacheBackend,
+    create_cache_backend, cache_store, AI_NAMESPACE, GITHUB_NAMESPACE
+)
+from .search import (
+    BM25Index, SearchIndex, SearchHit, SearchDocument, tokenize, stem,
+    get_search_index, search_content
+)
+from .writer import BatchWriter, batch_writer, enqueue_write, get_contact_hash, insert_contact_message
+from .content import (
+    ContentItem, ContentSnapshot, ContentStore, load_content,
+    get_content_snapshot, get_social_snapshot, get_content_version, get_content_mtime
 )
@@ -0,0 +1,176 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+DATA_COLLECTIONS = (
+    "skills", "services", "interests", "projects", "blog_posts",
+    "certifications", "academic_timeline", "dev_journey", "database"
+)
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+class ContentItem(SimpleNamespace):
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Content Item is Read-Only: '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Content Item is Read-Only: '{name}'")
+
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _to_items(raw_items: Any) -> Tuple[ContentItem, ...]:
+    if not isinstance(raw_items, list):
+        return ()
+    return tuple(ContentItem(**{k: freeze(v) for k, v in item.items()})
+                 for item in raw_items if isinstance(item, dict))
+
+
+@dataclass(frozen=True)
+class ContentSnapshot:
+    version: int = 0
+    digest: str = ""
+    mtime: float = 0.0
+    data: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAPPING)
+    collections: Mapping[str, Tuple[ContentItem, ...]] = field(
+        default_factory=lambda: _EMPTY_MAPPING)
+    slugs: Mapping[str, Mapping[str, ContentItem]] = field(
+        default_factory=lambda: _EMPTY_MAPPING)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def items(self, name: str) -> Tuple[ContentItem, ...]:
+        return self.collections.get(name, ())
+
+    def by_slug(self, name: str, slug: str) -> Optional[ContentItem]:
+        return self.slugs.get(name, _EMPTY_MAPPING).get(slug)
+
+
+class ContentStore:
+    def __init__(self, *path_parts: str, collections: Iterable[str] = (),
+                 check_interval: Optional[float] = None):
+        self.file_path = os.path.join(Config.ROOT_DIR, *path_parts)
+        self.collections = tuple(collections)
+        self.check_interval = Config.CONTENT_RELOAD_INTERVAL if check_interval is None else check_interval
+        self._snapshot = ContentSnapshot()
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> ContentSnapshot:
+        if time.monotonic() >= self._next_check:
+            self._refresh()
+        return self._snapshot
+
+    def reload(self) -> ContentSnapshot:
+        self._next_check = 0.0
+        return self.snapshot()
+
+    def _refresh(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_check:
+                return
+            self._next_check = now + self.check_interval
+            try:
+                mtime = os.stat(self.file_path).st_mtime
+            except OSError:
+                return
+            if self._snapshot.version and mtime == self._snapshot.mtime:
+                return
+            self._snapshot = self._load(mtime)
+
+    def _load(self, mtime: float) -> ContentSnapshot:
+        filename = os.path.basename(self.file_path)
+        try:
+            with open(self.file_path, "rb") as f:
+                raw_bytes = f.read()
+            raw = json.loads(raw_bytes.decode("utf-8"))
+        except Exception as e:
+            logger.error(f"⚠️ Error Reading {filename}: {e}")
+            return self._snapshot
+        digest = hashlib.sha256(raw_bytes).hexdigest()
+        if digest == self._snapshot.digest:
+            return ContentSnapshot(
+                version=self._snapshot.version, digest=digest, mtime=mtime,
+                data=self._snapshot.data, collections=self._snapshot.collections,
+                slugs=self._snapshot.slugs
+            )
+        collections = {name: _to_items(raw.get(name)) for name in self.collections}
+        slugs = {
+            name: MappingProxyType({
+                getattr(item, "slug"): item for item in items if getattr(item, "slug", None)
+            })
+            for name, items in collections.items()
+        }
+        snapshot = ContentSnapshot(
+            version=self._snapshot.version + 1,
+            digest=digest,
+            mtime=mtime,
+            data=freeze(raw),
+            collections=MappingProxyType(collections),
+            slugs=MappingProxyType(slugs)
+        )
+        if self._snapshot.version:
+            logger.info(f"✅ Content Reloaded: {filename} (v{snapshot.version})")
+        return snapshot
+
+
+data_store = ContentStore("app", "db", "data.json",
+                          collections=DATA_COLLECTIONS)
+social_store = ContentStore("app", "social", "social.json")
+
+
+def get_content_snapshot() -> ContentSnapshot:
+    return data_store.snapshot()
+
+
+def get_social_snapshot() -> ContentSnapshot:
+    return social_store.snapshot()
+
+
+def get_content_version() -> str:
+    data_digest = data_store.snapshot().digest
+    social_digest = social_store.snapshot().digest
+    return hashlib.sha256(f"{data_digest}:{social_digest}".encode()).hexdigest()[:16]
+
+
+def get_content_mtime() -> float:
+    return max(data_store.snapshot().mtime, social_store.snapshot().mtime)
+
+
+def get_social_section(name: str) -> Mapping[str, Any]:
+    return social_store.snapshot().get(name) or _EMPTY_MAPPING
+
+
+def load_content() -> Dict[str, ContentSnapshot]:
+    snapshots = {"data": data_store.reload(), "social": social_store.reload()}
+    logger.info(
+        f"✅ Content Snapshot Loaded (v{snapshots['data'].version}, {get_content_version()})")
+    return snapshots
@@ -1,14 +1,20 @@
+import time
 import logging
 import json
-from sqlalchemy import inspect, MetaData
-from sqlalchemy.sql import func
+from sqlalchemy import inspect, MetaData, or_
+from sqlalchemy.exc import IntegrityError
 from types import SimpleNamespace
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Mapping, Tuple
+from ..cache import MemoryCache, NOT_FOUND
 from ..config import Config
-from .database import SessionLocal, Base, engine
-from .models import GeminiCache, GitHubCache, ContactMessage, ChatMessage
-from ..utils import load_json_file
+from .content import ContentItem, get_content_snapshot
+from .search import SearchHit, search_content
+from .database import SessionLocal, engine
+from .migrations import run_migrations
+from .models import CacheLease, ChatMessage
+from .store import cache_store, AI_NAMESPACE, GITHUB_NAMESPACE
+from .writer import enqueue_write, insert_contact_message, AI_CACHE, GITHUB_CACHE, CHAT_LOG, CONTACT_MESSAGE
 
 logger = logging.getLogger(__name__)
 
@@ -23,114 +29,174 @@ class CacheKeys:
     GLOBAL_CONTEXT = GLOBAL_CONTEXT_KEY
 
 
-def load_json_data() -> Dict[str, Any]:
-    return load_json_file("app", "db", "data.json")
+memory_cache = MemoryCache(
+    "gemini_l1",
+    max_entries=Config.L1_CACHE_MAX_ENTRIES,
+    max_bytes=Config.L1_CACHE_MAX_BYTES,
+    default_ttl=Config.L1_CACHE_TTL
+)
 
 
-def _to_obj(data_list: List[Dict]) -> List[SimpleNamespace]:
-    return [SimpleNamespace(**item) for item in data_list]
+def get_cache_stats() -> Dict[str, Any]:
+    return memory_cache.stats
 
 
-def get_user_profile() -> Dict[str, Any]:
+def _remember(l1_key: tuple, value: Any, stored_at: float, max_age: Optional[float] = None) -> None:
+    ttl = Config.L1_CACHE_TTL
+    if max_age is not None:
+        ttl = min(ttl, max_age - (time.time() - stored_at))
+    if ttl > 0:
+        memory_cache.set(l1_key, (value, stored_at), ttl=ttl)
+
+
+def _remember_missing(l1_key: tuple) -> None:
+    memory_cache.set(l1_key, NOT_FOUND, ttl=Config.L1_NEGATIVE_TTL, size=0)
+
+
+def _recall(l1_key: tuple, max_age: Optional[float] = None) -> Any:
+    cached = memory_cache.get(l1_key)
+    if cached is None or cached is NOT_FOUND:
+        return cached
+    value, stored_at = cached
+    if max_age is not None and time.time() - stored_at >= max_age:
+        return NOT_FOUND
+    return value
+
+
+def load_json_data() -> Mapping[str, Any]:
+    return get_content_snapshot().data
+
+
+def _items(name: str) -> Tuple[ContentItem, ...]:
+    return get_content_snapshot().items(name)
+
+
+def get_user_profile() -> Mapping[str, Any]:
     return load_json_data().get("user_profile", {})
 
 
-def get_ai_config() -> Dict[str, Any]:
+def get_ai_config() -> Mapping[str, Any]:
     return load_json_data().get("ai_config", {})
 
 
-def get_stats() -> Dict[str, Any]:
+def get_stats() -> Mapping[str, Any]:
     return load_json_data().get("stats", {})
 
 
-def get_core_principles() -> List[Dict]:
-    return load_json_data().get("core_principles", [])
+def get_core_principles() -> Tuple[Mapping[str, Any], ...]:
+    return load_json_data().get("core_principles", ())
+
 
+def get_core_philosophy() -> Tuple[Mapping[str, Any], ...]:
+    return load_json_data().get("core_philosophy", ())
 
-def get_core_philosophy() -> List[Dict]:
-    return load_json_data().get("core_philosophy", [])
 
+def get_all_skills() -> Tuple[ContentItem, ...]:
+    return _items("skills")
 
-def get_all_skills() -> List[SimpleNamespace]:
-    return _to_obj(load_json_data().get("skills", []))
 
+def get_services() -> Tuple[ContentItem, ...]:
+    return _items("services")
 
-def get_services() -> List[SimpleNamespace]:
-    return _to_obj(load_json_data().get("services", []))
 
+def get_interests() -> Tuple[ContentItem, ...]:
+    return _items("interests")
 
-def get_interests() -> List[SimpleNamespace]:
-    return _to_obj(load_json_data().get("interests", []))
 
+def get_all_projects() -> Tuple[ContentItem, ...]:
+    return _items("projects")
 
-def get_all_projects() -> List[SimpleNamespace]:
-    return _to_obj(load_json_data().get("projects", []))
 
+def get_all_posts() -> Tuple[ContentItem, ...]:
+    return _items("blog_posts")
 
-def get_all_posts() -> List[SimpleNamespace]:
-    return _to_obj(load_json_data().get("blog_posts", []))
 
+def get_all_certifications() -> Tuple[ContentItem, ...]:
+    return _items("certifications")
 
-def get_all_certifications() -> List[SimpleNamespace]:
-    return _to_obj(load_json_data().get("certifications", []))
 
+def get_item_by_slug(collection: str, slug: str) -> Optional[ContentItem]:
+    return get_content_snapshot().by_slug(collection, slug)
 
-def get_timeline(event_type: str) -> List[SimpleNamespace]:
-    data = load_json_data()
+
+def get_timeline(event_type: str) -> Tuple[ContentItem, ...]:
     if event_type == 'academic':
-        return _to_obj(data.get("academic_timeline", []))
-    return _to_obj(data.get("dev_journey", []))
+        return _items("academic_timeline")
+    return _items("dev_journey")
 
 
-def get_all_database() -> List[SimpleNamespace]:
-    return _to_obj(load_json_data().get("database", []))
+def get_all_database() -> Tuple[ContentItem, ...]:
+    return _items("database")
 
 
-def search_database(user_query: str) -> List[SimpleNamespace]:
+def search_database(user_query: str, limit: Optional[int] = None) -> List[SearchHit]:
     if not user_query or len(user_query) < 3:
         return []
-    term = user_query.lower()
-    return [
-        item for item in get_all_database()
-        if term in getattr(item, 'category', '').lower() or term in getattr(item, 'info', '').lower()
-    ]
+    return search_content(user_query, limit)
 
 
-def get_cached_ai_response(cache_key: str, expiry_hours: int = 24) -> Optional[str]:
-    with SessionLocal() as db:
-        cache_entry = db.query(GeminiCache).filter_by(key=cache_key).first()
-        if cache_entry and cache_entry.timestamp:
-            current_time = datetime.now(timezone.utc)
-            entry_time = cache_entry.timestamp.replace(
-                tzinfo=timezone.utc) if cache_entry.timestamp.tzinfo is None else cache_entry.timestamp
-            if current_time - entry_time < timedelta(hours=expiry_hours):
-                return str(cache_entry.data)
+def get_cached_ai_response(cache_key: str, expiry_hours: int = 24, refresh: bool = False) -> Optional[str]:
+    l1_key = ("ai", cache_key)
+    max_age = expiry_hours * 3600
+    cached = None if refresh else _recall(l1_key, max_age)
+    if cached is NOT_FOUND:
         return None
+    if cached is not None:
+        return cached
+    entry = cache_store.get(AI_NAMESPACE, cache_key)
+    if entry and time.time() - entry.stored_at < max_age:
+        _remember(l1_key, entry.value, entry.stored_at, max_age)
+        return entry.value
+    _remember_missing(l1_key)
+    return None
+
+
+def get_cached_ai_responses(cache_keys: List[str], expiry_hours: int = 24) -> Dict[str, str]:
+    max_age = expiry_hours * 3600
+    found, pending = {}, []
+    for cache_key in dict.fromkeys(cache_keys):
+        cached = _recall(("ai", cache_key), max_age)
+        if cached is None:
+            pending.append(cache_key)
+        elif cached is not NOT_FOUND:
+            found[cache_key] = cached
+    if not pending:
+        return found
+    try:
+        entries = cache_store.get_many(AI_NAMESPACE, pending)
+    except Exception as e:
+        logger.error(f"❌ Gemini Cache Read Failed - {e}")
+        return found
+    for cache_key in pending:
+        entry = entries.get(cache_key)
+        if not entry:
+            _remember_missing(("ai", cache_key))
+            continue
+        _remember(("ai", cache_key), entry.value, entry.stored_at)
+        if time.time() - entry.stored_at < max_age:
+            found[cache_key] = entry.value
+    return found
 
 
 def set_cached_ai_response(cache_key: str, response_text: str) -> None:
-    with SessionLocal() as db:
-        try:
-            cache_entry = db.query(GeminiCache).filter_by(
-                key=cache_key).first()
-            if cache_entry:
-                cache_entry.data = response_text
-                cache_entry.timestamp = func.now()
-            else:
-                db.add(GeminiCache(key=cache_key, data=response_text))
-            db.commit()
-        except Exception as e:
-            logger.error(f"❌ Gemini Cache Save Failed - {e}")
-            db.rollback()
+    _remember(("ai", cache_key), response_text, time.time())
+    enqueue_write(AI_CACHE, key=cache_key, data=response_text)
 
 
 def get_cached_valid_models(expiry_hours: int = 6) -> Optional[List[str]]:
+    l1_key = ("models", VALID_MODELS_KEY)
+    cached = _recall(l1_key)
+    if cached is NOT_FOUND:
+        return None
+    if cached is not None:
+        return list(cached)
     try:
-        with SessionLocal() as db:
-            cache_entry = db.query(GeminiCache).filter_by(
-                key=VALID_MODELS_KEY).first()
-            if cache_entry:
-                return json.loads(cache_entry.data)
+        entry = cache_store.get(AI_NAMESPACE, VALID_MODELS_KEY)
+        if entry:
+            models = json.loads(entry.value)
+            _remember(l1_key, tuple(models), time.time())
+            return models
+        _remember_missing(l1_key)
     except Exception:
         pass
     return None
@@ -138,66 +204,85 @@ def get_cached_valid_models(expiry_hours: int = 6) -> Optional[List[str]]:
 
 def set_cached_valid_models(models: List[str]) -> None:
     try:
-        with SessionLocal() as db:
-            cache_entry = db.query(GeminiCache).filter_by(
-                key=VALID_MODELS_KEY).first()
-            now_utc = datetime.now(timezone.utc)
-            if cache_entry:
-                cache_entry.data = json.dumps(models)
-                cache_entry.timestamp = now_utc
-            else:
-                db.add(GeminiCache(key=VALID_MODELS_KEY,
-                       data=json.dumps(models), timestamp=now_utc))
-            db.commit()
+        cache_store.set(AI_NAMESPACE, VALID_MODELS_KEY, json.dumps(models))
+        _remember(("models", VALID_MODELS_KEY), tuple(models), time.time())
     except Exception as e:
         logger.error(f"❌ DB Cache Write Failed: {e}")
 
 
-def get_cached_github_data(cache_key: str, expiry_seconds: int = 3600) -> Optional[List[Dict[str, Any]]]:
+def get_github_snapshot(cache_key: str) -> Optional[Tuple[Any, float]]:
+    l1_key = ("github", cache_key)
+    cached = memory_cache.get(l1_key)
+    if cached is NOT_FOUND:
+        return None
+    if cached is not None:
+        return cached
     try:
-        with SessionLocal() as db:
-            cache_entry = db.query(GitHubCache).filter_by(
-                key=cache_key).first()
-            if cache_entry:
-                cache_time = cache_entry.timestamp.replace(
-                    tzinfo=timezone.utc) if cache_entry.timestamp.tzinfo is None else cache_entry.timestamp
-                if (datetime.now(timezone.utc) - cache_time).total_seconds() < expiry_seconds:
-                    return json.loads(cache_entry.data)
-                else:
-                    db.delete(cache_entry)
-                    db.commit()
-    except Exception:
-        pass
+        entry = cache_store.get(GITHUB_NAMESPACE, cache_key)
+        if entry:
+            data = json.loads(entry.value)
+            _remember(l1_key, data, entry.stored_at)
+            return data, entry.stored_at
+    except Exception as e:
+        logger.error(f"❌ GitHub Cache Read Failed - {e}")
+        return None
+    _remember_missing(l1_key)
+    return None
+
+
+def get_cached_github_data(cache_key: str, expiry_seconds: int = 3600) -> Optional[Any]:
+    snapshot = get_github_snapshot(cache_key)
+    if snapshot and time.time() - snapshot[1] < expiry_seconds:
+        return snapshot[0]
     return None
 
 
 def set_cached_github_data(cache_key: str, data: Any) -> None:
-    try:
-        with SessionLocal() as db:
-            cache_entry = db.query(GitHubCache).filter_by(
-                key=cache_key).first()
-            if cache_entry:
-                cache_entry.data = json.dumps(data)
-                cache_entry.timestamp = func.now()
-            else:
-                db.add(GitHubCache(key=cache_key, data=json.dumps(data)))
+    _remember(("github", cache_key), data, time.time())
+    enqueue_write(GITHUB_CACHE, key=cache_key, data=json.dumps(data))
+
+
+def acquire_lease(lease_key: str, owner: str, ttl_seconds: float, fail_open: bool = False) -> bool:
+    now_utc = datetime.now(timezone.utc)
+    expires_at = now_utc + timedelta(seconds=ttl_seconds)
+    with SessionLocal() as db:
+        try:
+            claimed = db.query(CacheLease).filter(
+                CacheLease.key == lease_key,
+                or_(CacheLease.expires_at < now_utc, CacheLease.owner == owner)
+            ).update({"owner": owner, "expires_at": expires_at}, synchronize_session=False)
+            if not claimed:
+                db.add(CacheLease(key=lease_key, owner=owner, expires_at=expires_at))
             db.commit()
-    except Exception as e:
-        logger.error(f"❌ GitHub Cache Write Failed - {e}")
-        db.rollback()
+            return True
+        except IntegrityError:
+            db.rollback()
+            return False
+        except Exception as e:
+            logger.error(f"❌ Lease Acquire Failed - {e}")
+            db.rollback()
+            return fail_open
+
+
+def release_lease(lease_key: str, owner: str) -> None:
+    with SessionLocal() as db:
+        try:
+            db.query(CacheLease).filter_by(key=lease_key, owner=owner).delete(
+                synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            logger.error(f"❌ Lease Release Failed - {e}")
+            db.rollback()
 
 
 def save_contact_message(name: str, email: str, subject: str, message: str) -> bool:
+    payload = {"name": name, "email": email,
+               "subject": subject if subject else "No Subject", "message": message}
+    if Config.CONTACT_ASYNC_WRITE and enqueue_write(CONTACT_MESSAGE, **payload):
+        return True
     with SessionLocal() as db:
         try:
-            subject_text = subject if subject else "No Subject"
-            existing_msg = db.query(ContactMessage).filter_by(
-                name=name, email=email, subject=subject_text, message=message
-            ).first()
-            if existing_msg:
-                return True
-            db.add(ContactMessage(name=name, email=email,
-                   subject=subject_text, message=message))
+            insert_contact_message(db, payload, datetime.now(timezone.utc))
             db.commit()
             return True
         except Exception as e:
@@ -209,14 +294,8 @@ def save_contact_message(name: str, email: str, subject: str, message: str) -> b
 def log_conversation(session_id: str, u: str, b: str) -> None:
     if not u or not b:
         return
-    with SessionLocal() as db:
-        try:
-            db.add(ChatMessage(session_id=session_id or "default",
-                   user_query=u, bot_response=b))
-            db.commit()
-        except Exception as e:
-            logger.error(f"❌ Chat Log Save Failed - {e}")
-            db.rollback()
+    enqueue_write(CHAT_LOG, session_id=session_id or "default",
+                  user_query=u, bot_response=b)
 
 
 def get_chat_history(session_id: str, limit: int = 10) -> List[SimpleNamespace]:
@@ -245,7 +324,7 @@ def get_database_provider() -> str:
 
 
 def auto_migrate_db():
-    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
 
 
 def setup_database_tables() -> None:
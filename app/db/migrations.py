@@ -0,0 +1,146 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Set
+from sqlalchemy import Column, inspect, select, text, update
+from sqlalchemy.engine import Connection, Engine
+from .database import Base, engine
+from .models import GeminiCache, GitHubCache, ChatMessage, ContactMessage, SchemaVersion
+from .retention import get_cache_retention
+from .writer import get_contact_hash
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+
+
+def _has_column(conn: Connection, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(conn).get_columns(table))
+
+
+def _has_index(conn: Connection, table: str, index: str) -> bool:
+    return any(i["name"] == index for i in inspect(conn).get_indexes(table))
+
+
+def _add_column(conn: Connection, model, column: Column) -> None:
+    table = model.__tablename__
+    if _has_column(conn, table, column.name):
+        return
+    column_type = column.type.compile(dialect=conn.dialect)
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column.name} {column_type}"))
+
+
+def _create_index(conn: Connection, model, name: str) -> None:
+    if _has_index(conn, model.__tablename__, name):
+        return
+    index = next(i for i in model.__table__.indexes if i.name == name)
+    index.create(conn, checkfirst=True)
+
+
+def _backfill_expiry(conn: Connection, model, retention: timedelta) -> None:
+    rows = conn.execute(select(model.id, model.timestamp).where(model.expires_at.is_(None))).all()
+    now = datetime.now(timezone.utc)
+    for row_id, timestamp in rows:
+        conn.execute(update(model).where(model.id == row_id).values(
+            expires_at=(timestamp or now) + retention))
+
+
+def _baseline(conn: Connection) -> None:
+    Base.metadata.create_all(bind=conn)
+
+
+def _chat_history_index(conn: Connection) -> None:
+    _create_index(conn, ChatMessage, "ix_chat_messages_session_timestamp")
+    _create_index(conn, ChatMessage, "ix_chat_messages_timestamp")
+    conn.execute(text("DROP INDEX IF EXISTS ix_chat_messages_session_id"))
+
+
+def _cache_expiry(conn: Connection) -> None:
+    for model in (GeminiCache, GitHubCache):
+        _add_column(conn, model, model.__table__.c.expires_at)
+        _create_index(conn, model, f"ix_{model.__tablename__}_expires_at")
+        _backfill_expiry(conn, model, get_cache_retention(model))
+
+
+def _contact_content_hash(conn: Connection) -> None:
+    _add_column(conn, ContactMessage, ContactMessage.__table__.c.content_hash)
+    rows = conn.execute(select(
+        ContactMessage.id, ContactMessage.name, ContactMessage.email,
+        ContactMessage.subject, ContactMessage.message
+    ).where(ContactMessage.content_hash.is_(None)).order_by(ContactMessage.id)).all()
+    seen = set(conn.scalars(select(ContactMessage.content_hash).where(
+        ContactMessage.content_hash.is_not(None))))
+    for row_id, name, email, subject, message in rows:
+        content_hash = get_contact_hash(name or "", email or "", subject or "", message or "")
+        if content_hash in seen:
+            continue
+        seen.add(content_hash)
+        conn.execute(update(ContactMessage).where(ContactMessage.id == row_id).values(
+            content_hash=content_hash))
+    _create_index(conn, ContactMessage, "ix_contact_messages_content_hash")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "baseline", _baseline),
+    Migration(2, "chat_history_index", _chat_history_index),
+    Migration(3, "cache_expiry", _cache_expiry),
+    Migration(4, "contact_content_hash", _contact_content_hash),
+]
+
+
+def get_applied_versions(bind: Engine = engine) -> Set[int]:
+    with bind.connect() as conn:
+        return set(conn.scalars(select(SchemaVersion.version)))
+
+
+def _is_fresh(conn: Connection) -> bool:
+    existing = set(inspect(conn).get_table_names()) - {SchemaVersion.__tablename__}
+    return not existing.intersection(Base.metadata.tables)
+
+
+def _create_current_schema(bind: Engine) -> bool:
+    try:
+        with bind.begin() as conn:
+            if not _is_fresh(conn):
+                return False
+            Base.metadata.create_all(bind=conn)
+            now = datetime.now(timezone.utc)
+            conn.execute(SchemaVersion.__table__.insert(), [
+                {"version": m.version, "name": m.name, "applied_at": now} for m in MIGRATIONS
+            ])
+    except Exception:
+        if get_applied_versions(bind):
+            return False
+        raise
+    logger.info(f"✅ Schema Created at Version {MIGRATIONS[-1].version:03d}")
+    return True
+
+
+def run_migrations(bind: Engine = engine) -> int:
+    SchemaVersion.__table__.create(bind, checkfirst=True)
+    applied = get_applied_versions(bind)
+    if not applied and _create_current_schema(bind):
+        return len(MIGRATIONS)
+    applied = applied or get_applied_versions(bind)
+    count = 0
+    for migration in MIGRATIONS:
+        if migration.version in applied:
+            continue
+        try:
+            with bind.begin() as conn:
+                migration.apply(conn)
+                conn.execute(SchemaVersion.__table__.insert().values(
+                    version=migration.version, name=migration.name,
+                    applied_at=datetime.now(timezone.utc)))
+        except Exception:
+            if migration.version in get_applied_versions(bind):
+                continue
+            raise
+        count += 1
+        logger.info(f"✅ Migration Applied ({migration.version:03d} {migration.name})")
+    return count
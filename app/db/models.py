@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import String, Text, DateTime
+from typing import Optional
+from sqlalchemy import Index, String, Text, DateTime
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from .database import Base
@@ -13,6 +14,8 @@ class GeminiCache(Base):
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=func.now(), onupdate=func.now()
     )
+    expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True)
 
 
 class GitHubCache(Base):
@@ -23,6 +26,16 @@ class GitHubCache(Base):
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=func.now(), onupdate=func.now()
     )
+    expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True)
+
+
+class CacheLease(Base):
+    __tablename__ = 'cache_leases'
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    owner: Mapped[str] = mapped_column(String(255))
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), index=True)
 
 
 class ContactMessage(Base):
@@ -32,6 +45,8 @@ class ContactMessage(Base):
     email: Mapped[str] = mapped_column(String(150))
     subject: Mapped[str] = mapped_column(String(200))
     message: Mapped[str] = mapped_column(Text)
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(64), unique=True, index=True, nullable=True)
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=func.now()
     )
@@ -39,10 +54,22 @@ class ContactMessage(Base):
 
 class ChatMessage(Base):
     __tablename__ = 'chat_messages'
+    __table_args__ = (
+        Index('ix_chat_messages_session_timestamp', 'session_id', 'timestamp'),
+    )
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    session_id: Mapped[str] = mapped_column(String(100), index=True)
+    session_id: Mapped[str] = mapped_column(String(100))
     user_query: Mapped[str] = mapped_column(Text)
     bot_response: Mapped[str] = mapped_column(Text)
     timestamp: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=func.now(), index=True
+    )
+
+
+class SchemaVersion(Base):
+    __tablename__ = 'schema_version'
+    version: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(100))
+    applied_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=func.now()
     )
@@ -0,0 +1,54 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+from sqlalchemy import Table, delete, select
+from sqlalchemy.sql.elements import ColumnElement
+from ..config import Config
+from .database import engine
+from .models import GitHubCache, CacheLease, ChatMessage
+
+logger = logging.getLogger(__name__)
+
+
+def get_cache_retention(model) -> timedelta:
+    if model is GitHubCache:
+        return timedelta(days=Config.GITHUB_CACHE_RETENTION_DAYS)
+    return timedelta(hours=Config.AI_CACHE_TTL_HOURS)
+
+
+def prune_table(table: Table, condition: ColumnElement, batch_size: int, max_batches: int) -> int:
+    primary_key = next(iter(table.primary_key.columns))
+    total = 0
+    for _ in range(max_batches):
+        batch = select(primary_key).where(condition).limit(batch_size).scalar_subquery()
+        with engine.begin() as conn:
+            deleted = conn.execute(delete(table).where(primary_key.in_(batch))).rowcount
+        total += deleted
+        if deleted < batch_size:
+            break
+    return total
+
+
+def prune_database(batch_size: int = 0, max_batches: int = 0) -> Dict[str, int]:
+    from .store import cache_store
+    batch_size = batch_size or Config.PRUNE_BATCH_SIZE
+    max_batches = max_batches or Config.PRUNE_MAX_BATCHES
+    now = datetime.now(timezone.utc)
+    targets = [(CacheLease.__table__, CacheLease.expires_at < now)]
+    if Config.CHAT_RETENTION_DAYS > 0:
+        targets.append((ChatMessage.__table__,
+                        ChatMessage.timestamp < now - timedelta(days=Config.CHAT_RETENTION_DAYS)))
+    try:
+        pruned = cache_store.prune(batch_size, max_batches)
+    except Exception as e:
+        pruned = {}
+        logger.error(f"❌ Prune Failed ({cache_store.name} cache) - {e}")
+    for table, condition in targets:
+        try:
+            pruned[table.name] = prune_table(table, condition, batch_size, max_batches)
+        except Exception as e:
+            logger.error(f"❌ Prune Failed ({table.name}) - {e}")
+    if any(pruned.values()):
+        summary = ", ".join(f"{name} {count}" for name, count in pruned.items() if count)
+        logger.info(f"✅ Database Pruned ({summary})")
+    return pruned
@@ -0,0 +1,190 @@
+import re
+import math
+import heapq
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from ..config import Config
+from .content import get_content_snapshot, get_content_version
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+MARKUP_PATTERN = re.compile(r"<[^>]+>|[*_`#]+")
+
+STOPWORDS = frozenset("""
+a about an and any are as at be been but by can could did do does for from has have he her his how i
+if in into is it its me my of on or our please she show so tell than that the their them then there
+these they this to us was we were what when where which who why will with would you your
+""".split())
+
+SUFFIXES = (
+    ("ational", "ate"), ("ization", "ize"), ("fulness", "ful"), ("iveness", "ive"),
+    ("ities", "ity"), ("ment", ""), ("ness", ""), ("ies", "y"), ("ing", ""),
+    ("ed", ""), ("er", ""), ("ly", ""), ("s", "")
+)
+
+SEARCH_FIELDS = {
+    "database": ("category", ("info",)),
+    "projects": ("title", ("category", "description", "content", "tech_stack")),
+    "blog_posts": ("title", ("category", "summary", "content")),
+    "skills": ("name", ("category",)),
+    "certifications": ("title", ("issuer", "status", "description")),
+    "services": ("title", ("description",)),
+}
+
+
+def stem(token: str) -> str:
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    if token.endswith("es") and token[-3] in "sxz" or token.endswith(("ches", "shes")):
+        token = token[:-2]
+    else:
+        for suffix, replacement in SUFFIXES:
+            if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+                token = token[:-len(suffix)] + replacement
+                break
+    if len(token) > 3 and token[-1] == token[-2] and token[-1] not in "lsz":
+        token = token[:-1]
+    if len(token) > 3 and token.endswith("e"):
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    return [stem(token) for token in TOKEN_PATTERN.findall(text.lower())
+            if len(token) > 1 and token not in STOPWORDS]
+
+
+class BM25Index:
+    def __init__(self, documents: Sequence[Sequence[str]], k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.lengths = [len(tokens) for tokens in documents]
+        self.avg_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        for doc_id, tokens in enumerate(documents):
+            for term, frequency in Counter(tokens).items():
+                self.postings.setdefault(term, []).append((doc_id, frequency))
+        total = len(documents)
+        self.idf = {
+            term: math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self.postings.items()
+        }
+
+    def scores(self, query_tokens: Iterable[str]) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        for term in set(query_tokens):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, frequency in self.postings[term]:
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / (self.avg_length or 1))
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+        return scores
+
+    def top(self, query_tokens: Iterable[str], k: int) -> List[Tuple[float, int]]:
+        return heapq.nlargest(k, ((score, doc_id) for doc_id, score in self.scores(query_tokens).items()))
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    collection: str
+    title: str
+    body: str
+    slug: Optional[str] = None
+    answer: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    collection: str
+    title: str
+    snippet: str
+    score: float
+    slug: Optional[str] = None
+
+    @property
+    def info(self) -> str:
+        return self.snippet
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return MARKUP_PATTERN.sub("\n", str(value)) if value else ""
+
+
+def make_snippet(body: str, query_tokens: Sequence[str], max_chars: int = 220) -> str:
+    wanted = set(query_tokens)
+    sentences = [" ".join(s.split()) for s in SENTENCE_PATTERN.split(body) if s.strip()]
+    if not sentences:
+        return ""
+    best = max(sentences, key=lambda s: len(wanted.intersection(tokenize(s))))
+    return best if len(best) <= max_chars else best[:max_chars].rsplit(" ", 1)[0] + "…"
+
+
+class SearchIndex:
+    def __init__(self, version: str, documents: Sequence[SearchDocument], title_weight: int = 2,
+                 ignored_terms: Iterable[str] = ()):
+        self.version = version
+        self.documents = list(documents)
+        self.ignored_terms = frozenset(ignored_terms)
+        self.index = BM25Index([
+            tokenize(doc.title) * title_weight + tokenize(doc.body) for doc in self.documents
+        ])
+
+    def search(self, query: str, limit: int = 3, min_ratio: float = 0.3) -> List[SearchHit]:
+        query_tokens = [t for t in tokenize(query) if t not in self.ignored_terms]
+        ranked = self.index.top(query_tokens, limit)
+        if not ranked:
+            return []
+        floor = ranked[0][0] * min_ratio
+        hits = []
+        for score, doc_id in ranked:
+            if score < floor:
+                break
+            doc = self.documents[doc_id]
+            snippet = doc.answer or make_snippet(doc.body, query_tokens)
+            hits.append(SearchHit(doc.collection, doc.title, snippet, round(score, 4), doc.slug))
+        return hits
+
+
+def build_search_documents() -> List[SearchDocument]:
+    snapshot = get_content_snapshot()
+    documents = []
+    for collection, (title_field, body_fields) in SEARCH_FIELDS.items():
+        for item in snapshot.items(collection):
+            title = _field_text(getattr(item, title_field, ""))
+            body = "\n".join(filter(None, (_field_text(getattr(item, f, "")) for f in body_fields)))
+            answer = str(getattr(item, "info", "") or "") if collection == "database" else None
+            if title or body:
+                documents.append(SearchDocument(collection, title, body, getattr(item, "slug", None), answer))
+    return documents
+
+
+_index: Optional[SearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    global _index
+    version = get_content_version()
+    index = _index
+    if index is not None and index.version == version:
+        return index
+    with _index_lock:
+        if _index is None or _index.version != version:
+            owner = get_content_snapshot().get("user_profile", {}).get("name", "")
+            _index = SearchIndex(version, build_search_documents(), ignored_terms=tokenize(owner))
+            logger.info(f"✅ Search Index Built ({len(_index.documents)} Documents, {len(_index.index.postings)} Terms)")
+        return _index
+
+
+def search_content(query: str, limit: Optional[int] = None) -> List[SearchHit]:
+    if not query:
+        return []
+    return get_search_index().search(query, limit or Config.SEARCH_TOP_K)
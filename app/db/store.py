@@ -0,0 +1,252 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from ..cache import MemoryCache
+from ..config import Config
+from .database import engine
+from .models import GeminiCache, GitHubCache
+from .retention import get_cache_retention, prune_table
+
+logger = logging.getLogger(__name__)
+
+AI_NAMESPACE = "ai"
+GITHUB_NAMESPACE = "github"
+
+NAMESPACE_MODELS = {AI_NAMESPACE: GeminiCache, GITHUB_NAMESPACE: GitHubCache}
+
+UPSERT_DIALECTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+class CacheEntry(NamedTuple):
+    value: str
+    stored_at: float
+    expires_at: Optional[float]
+
+
+def get_namespace_ttl(namespace: str) -> timedelta:
+    return get_cache_retention(NAMESPACE_MODELS.get(namespace))
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+    return timestamp.replace(tzinfo=timezone.utc) if timestamp.tzinfo is None else timestamp
+
+
+def _is_expired(entry: CacheEntry, now: float) -> bool:
+    return entry.expires_at is not None and entry.expires_at <= now
+
+
+class CacheBackend(ABC):
+    name = "base"
+
+    @abstractmethod
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        ...
+
+    @abstractmethod
+    def set_many(self, namespace: str, items: Mapping[str, str], stored_at: Optional[datetime] = None,
+                 ttl: Optional[timedelta] = None, db: Any = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        ...
+
+    def prune(self, batch_size: int, max_batches: int) -> Dict[str, int]:
+        return {}
+
+    def get(self, namespace: str, key: str) -> Optional[CacheEntry]:
+        return self.get_many(namespace, [key]).get(key)
+
+    def set(self, namespace: str, key: str, value: str, ttl: Optional[timedelta] = None) -> None:
+        self.set_many(namespace, {key: value}, ttl=ttl)
+
+    @staticmethod
+    def _window(namespace: str, stored_at: Optional[datetime],
+                ttl: Optional[timedelta]) -> Tuple[datetime, datetime]:
+        stored_at = stored_at or datetime.now(timezone.utc)
+        return stored_at, stored_at + (ttl or get_namespace_ttl(namespace))
+
+
+class SQLCacheBackend(CacheBackend):
+    name = "sql"
+
+    def __init__(self, bind: Engine):
+        self.bind = bind
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        model = NAMESPACE_MODELS[namespace]
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        with self.bind.connect() as conn:
+            rows = conn.execute(select(model.key, model.data, model.timestamp, model.expires_at).where(
+                model.key.in_(keys))).all()
+        now = time.time()
+        entries = {}
+        for key, data, timestamp, expires_at in rows:
+            if not timestamp:
+                continue
+            entry = CacheEntry(str(data), _as_utc(timestamp).timestamp(),
+                               _as_utc(expires_at).timestamp() if expires_at else None)
+            if not _is_expired(entry, now):
+                entries[key] = entry
+        return entries
+
+    def set_many(self, namespace: str, items: Mapping[str, str], stored_at: Optional[datetime] = None,
+                 ttl: Optional[timedelta] = None, db: Any = None) -> None:
+        if not items:
+            return
+        stored_at, expires_at = self._window(namespace, stored_at, ttl)
+        rows = [{"key": key, "data": value, "timestamp": stored_at, "expires_at": expires_at}
+                for key, value in items.items()]
+        if db is not None:
+            self._upsert(db, NAMESPACE_MODELS[namespace], rows)
+            return
+        with self.bind.begin() as conn:
+            self._upsert(conn, NAMESPACE_MODELS[namespace], rows)
+
+    def _upsert(self, db: Any, model, rows: List[Dict[str, Any]]) -> None:
+        insert = UPSERT_DIALECTS.get(self.bind.dialect.name)
+        if insert is None:
+            self._merge(db, model, rows)
+            return
+        stmt = insert(model.__table__).values(rows)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[model.__table__.c.key],
+            set_={column: stmt.excluded[column] for column in ("data", "timestamp", "expires_at")}
+        ))
+
+    @staticmethod
+    def _merge(db: Any, model, rows: List[Dict[str, Any]]) -> None:
+        table = model.__table__
+        existing = set(db.execute(select(table.c.key).where(
+            table.c.key.in_([row["key"] for row in rows]))).scalars())
+        for row in rows:
+            if row["key"] in existing:
+                db.execute(table.update().where(table.c.key == row["key"]).values(**row))
+            else:
+                db.execute(table.insert().values(**row))
+
+    def delete(self, namespace: str, key: str) -> None:
+        table = NAMESPACE_MODELS[namespace].__table__
+        with self.bind.begin() as conn:
+            conn.execute(table.delete().where(table.c.key == key))
+
+    def prune(self, batch_size: int, max_batches: int) -> Dict[str, int]:
+        now = datetime.now(timezone.utc)
+        return {
+            model.__tablename__: prune_table(model.__table__, model.expires_at < now, batch_size, max_batches)
+            for model in NAMESPACE_MODELS.values()
+        }
+
+
+class MemoryCacheBackend(CacheBackend):
+    name = "memory"
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 32 * 1024 * 1024):
+        self.store = MemoryCache("cache_store", max_entries=max_entries, max_bytes=max_bytes)
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        entries = {}
+        for key in keys:
+            entry = self.store.get((namespace, key))
+            if entry is not None:
+                entries[key] = entry
+        return entries
+
+    def set_many(self, namespace: str, items: Mapping[str, str], stored_at: Optional[datetime] = None,
+                 ttl: Optional[timedelta] = None, db: Any = None) -> None:
+        stored_at, expires_at = self._window(namespace, stored_at, ttl)
+        ttl_seconds = (expires_at - stored_at).total_seconds()
+        for key, value in items.items():
+            self.store.set((namespace, key), CacheEntry(value, stored_at.timestamp(), expires_at.timestamp()),
+                           ttl=ttl_seconds, size=len(value))
+
+    def delete(self, namespace: str, key: str) -> None:
+        self.store.delete((namespace, key))
+
+
+class FileCacheBackend(CacheBackend):
+    name = "file"
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _path(self, namespace: str, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.root / namespace / digest[:2] / f"{digest}.json"
+
+    def _read(self, path: Path) -> Optional[CacheEntry]:
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(record["value"], record["stored_at"], record.get("expires_at"))
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        now = time.time()
+        entries = {}
+        for key in keys:
+            entry = self._read(self._path(namespace, key))
+            if entry is not None and not _is_expired(entry, now):
+                entries[key] = entry
+        return entries
+
+    def set_many(self, namespace: str, items: Mapping[str, str], stored_at: Optional[datetime] = None,
+                 ttl: Optional[timedelta] = None, db: Any = None) -> None:
+        stored_at, expires_at = self._window(namespace, stored_at, ttl)
+        for key, value in items.items():
+            path = self._path(namespace, key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.write_text(json.dumps({
+                "key": key, "value": value,
+                "stored_at": stored_at.timestamp(), "expires_at": expires_at.timestamp()
+            }), encoding="utf-8")
+            os.replace(temp_path, path)
+
+    def delete(self, namespace: str, key: str) -> None:
+        try:
+            self._path(namespace, key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def prune(self, batch_size: int, max_batches: int) -> Dict[str, int]:
+        now = time.time()
+        budget = batch_size * max_batches
+        pruned = {}
+        for namespace in NAMESPACE_MODELS:
+            count = 0
+            for path in (self.root / namespace).glob("*/*.json"):
+                if count >= budget:
+                    break
+                entry = self._read(path)
+                if entry is None or _is_expired(entry, now):
+                    path.unlink(missing_ok=True)
+                    count += 1
+            pruned[namespace] = count
+        return pruned
+
+
+def create_cache_backend(name: str) -> CacheBackend:
+    if name == "memory":
+        return MemoryCacheBackend()
+    if name == "file":
+        return FileCacheBackend(Path(Config.CACHE_FILE_DIR))
+    if name != "sql":
+        logger.warning(f"⚠️ Unknown Cache Backend '{name}' - Using SQL")
+    return SQLCacheBackend(engine)
+
+
+cache_store = create_cache_backend(Config.CACHE_BACKEND)
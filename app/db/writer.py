@@ -0,0 +1,214 @@
+import os
+import json
+import hashlib
+import time
+import queue
+import atexit
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from ..config import Config
+from .database import SessionLocal
+from .models import ChatMessage, ContactMessage
+from .store import cache_store, AI_NAMESPACE, GITHUB_NAMESPACE, UPSERT_DIALECTS
+
+logger = logging.getLogger(__name__)
+
+CHAT_LOG = "chat_log"
+AI_CACHE = "ai_cache"
+GITHUB_CACHE = "github_cache"
+CONTACT_MESSAGE = "contact_message"
+
+_CACHE_NAMESPACES = {AI_CACHE: AI_NAMESPACE, GITHUB_CACHE: GITHUB_NAMESPACE}
+
+
+@dataclass(frozen=True)
+class WriteOp:
+    kind: str
+    payload: Dict[str, Any]
+    created_at: datetime
+
+
+class BatchWriter:
+    def __init__(self, batch_size: int = 50, flush_interval: float = 0.2,
+                 max_queue: int = 2000, overflow: str = "drop", block_seconds: float = 0.05):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.block_seconds = block_seconds
+        self._queue: "queue.Queue[Optional[WriteOp]]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self._idle = threading.Condition()
+        self._pending = 0
+        self._stats_lock = threading.Lock()
+        self._stats = {"submitted": 0, "written": 0, "dropped": 0, "failed": 0, "batches": 0, "retried": 0}
+
+    def submit(self, kind: str, **payload: Any) -> bool:
+        self._ensure_started()
+        op = WriteOp(kind, payload, datetime.now(timezone.utc))
+        with self._idle:
+            self._pending += 1
+        try:
+            if self.overflow == "block":
+                self._queue.put(op, timeout=self.block_seconds)
+            else:
+                self._queue.put_nowait(op)
+        except queue.Full:
+            self._mark_done(1)
+            self._count(dropped=1)
+            logger.warning(f"⚠️ Write Queue Full - Dropped {kind}")
+            return False
+        self._count(submitted=1)
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        if not self._thread or not self._thread.is_alive():
+            return self._pending == 0
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if not self._thread or not self._thread.is_alive() or self._pid != os.getpid():
+            return
+        self.flush(timeout)
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def reset(self) -> None:
+        self._thread = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._idle = threading.Condition()
+        self._pending = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {**self._stats, "queued": self._queue.qsize()}
+
+    def _count(self, **deltas: int) -> None:
+        with self._stats_lock:
+            for key, delta in deltas.items():
+                self._stats[key] += delta
+
+    def _ensure_started(self) -> None:
+        if self._thread and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid != os.getpid():
+                self.reset()
+            if not self._thread or not self._thread.is_alive():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run, name="db-batch-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            op = self._queue.get()
+            if op is None:
+                return
+            batch = [op]
+            stopping = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    op = self._queue.get(
+                        timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if op is None:
+                    stopping = True
+                    break
+                batch.append(op)
+            self._write_batch(batch)
+            self._mark_done(len(batch))
+            if stopping:
+                return
+
+    def _mark_done(self, count: int) -> None:
+        with self._idle:
+            self._pending -= count
+            if self._pending <= 0:
+                self._idle.notify_all()
+
+    def _write_batch(self, batch: List[WriteOp]) -> None:
+        with SessionLocal() as db:
+            try:
+                write_ops(db, batch)
+                db.commit()
+                self._count(written=len(batch), batches=1)
+                return
+            except Exception as e:
+                db.rollback()
+                if len(batch) == 1:
+                    self._count(failed=1)
+                    logger.error(f"❌ Write Failed ({batch[0].kind}) - {e}")
+                    return
+                logger.warning(f"⚠️ Batch Write Failed ({len(batch)} Rows) - Retrying Individually: {e}")
+        self._count(retried=len(batch))
+        for op in batch:
+            self._write_batch([op])
+
+
+def write_ops(db, batch: List[WriteOp]) -> None:
+    upserts: Dict[str, Dict[str, WriteOp]] = {}
+    for op in batch:
+        if op.kind == CHAT_LOG:
+            db.add(ChatMessage(timestamp=op.created_at, **op.payload))
+        elif op.kind == CONTACT_MESSAGE:
+            insert_contact_message(db, op.payload, op.created_at)
+        elif op.kind in _CACHE_NAMESPACES:
+            upserts.setdefault(_CACHE_NAMESPACES[op.kind], {})[op.payload["key"]] = op
+    for namespace, ops in upserts.items():
+        items = {
+            key: op.payload["data"] if isinstance(op.payload["data"], str) else json.dumps(op.payload["data"])
+            for key, op in ops.items()
+        }
+        cache_store.set_many(namespace, items, stored_at=max(op.created_at for op in ops.values()), db=db)
+
+
+def get_contact_hash(name: str, email: str, subject: str, message: str) -> str:
+    parts = (name.strip(), email.strip().lower(), subject.strip(), message.strip())
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def insert_contact_message(db, payload: Dict[str, Any], created_at: datetime) -> None:
+    row = {**payload, "timestamp": created_at,
+           "content_hash": get_contact_hash(payload["name"], payload["email"],
+                                            payload["subject"], payload["message"])}
+    table = ContactMessage.__table__
+    insert = UPSERT_DIALECTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        db.execute(insert(table).values(row).on_conflict_do_nothing(
+            index_elements=[table.c.content_hash]))
+    elif db.execute(table.select().where(table.c.content_hash == row["content_hash"])).first() is None:
+        db.execute(table.insert().values(row))
+
+
+batch_writer = BatchWriter(
+    batch_size=Config.DB_WRITE_BATCH_SIZE,
+    flush_interval=Config.DB_WRITE_FLUSH_MS / 1000,
+    max_queue=Config.DB_WRITE_QUEUE_SIZE,
+    overflow=Config.DB_WRITE_OVERFLOW
+)
+atexit.register(batch_writer.stop)
+
+
+def enqueue_write(kind: str, **payload: Any) -> bool:
+    if not Config.DB_WRITE_BEHIND:
+        with SessionLocal() as db:
+            try:
+                write_ops(db, [WriteOp(kind, payload, datetime.now(timezone.utc))])
+                db.commit()
+                return True
+            except Exception as e:
+                logger.error(f"❌ Direct Write Failed ({kind}) - {e}")
+                db.rollback()
+                return False
+    return batch_writer.submit(kind, **payload)
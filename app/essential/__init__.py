@@ -1 +1,2 @@
-from .essential import limiter, is_main_process, markdown_filter,  format_date
+from .essential import limiter, is_main_process, markdown_filter,  format_date, render_markdown, warm_markdown_cache
+from .rate_limit import SQLiteStorage, SQLITE_SCHEME
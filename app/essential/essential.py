@@ -1,16 +1,24 @@
 import os
+import hashlib
 import logging
-import markdown
-import bleach
+import threading
+from typing import TYPE_CHECKING, Iterable, Optional
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from ..cache import MemoryCache
+from ..config import Config
+from .rate_limit import SQLiteStorage, SQLITE_SCHEME
+
+if TYPE_CHECKING:
+    import markdown
+    import bleach
 
 logger = logging.getLogger(__name__)
 
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["2000 per day", "500 per hour"],
-    storage_uri=os.getenv("REDIS_URL", "memory://")
+    storage_uri=Config.REDIS_URL or f"{SQLITE_SCHEME}://{Config.RATE_LIMIT_DB_PATH}"
 )
 
 
@@ -29,18 +37,64 @@ def format_date(value, format_string='%B %d, %Y'):
         return str(value)
 
 
+MARKDOWN_EXTENSIONS = ('fenced_code', 'codehilite')
+
+_markdown_cache = MemoryCache(
+    "markdown", max_entries=Config.MARKDOWN_CACHE_SIZE, max_bytes=8 * 1024 * 1024)
+_markdown_local = threading.local()
+_cleaner: Optional["bleach.sanitizer.Cleaner"] = None
+_cleaner_lock = threading.Lock()
+
+
+def _get_cleaner() -> "bleach.sanitizer.Cleaner":
+    global _cleaner
+    if _cleaner is None:
+        with _cleaner_lock:
+            if _cleaner is None:
+                import bleach
+                allowed_tags = frozenset(bleach.sanitizer.ALLOWED_TAGS | {
+                    'p', 'h1', 'h2', 'h3', 'h4', 'br', 'strong', 'em', 'ul', 'ol',
+                    'li', 'a', 'code', 'pre', 'blockquote', 'span'
+                })
+                allowed_attrs = {
+                    **bleach.sanitizer.ALLOWED_ATTRIBUTES,
+                    'a': ['href', 'title', 'target'],
+                    '*': ['class']
+                }
+                _cleaner = bleach.sanitizer.Cleaner(
+                    tags=allowed_tags, attributes=allowed_attrs)
+    return _cleaner
+
+
+def _get_renderer() -> "markdown.Markdown":
+    renderer = getattr(_markdown_local, "renderer", None)
+    if renderer is None:
+        import markdown
+        renderer = markdown.Markdown(extensions=list(MARKDOWN_EXTENSIONS))
+        _markdown_local.renderer = renderer
+    return renderer.reset()
+
+
+def render_markdown(text: str) -> str:
+    cache_key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    html = _markdown_cache.get(cache_key)
+    if html is None:
+        raw_html = _get_renderer().convert(text)
+        html = _get_cleaner().clean(raw_html)
+        _markdown_cache.set(cache_key, html)
+    return html
+
+
+def warm_markdown_cache(texts: Iterable[str]) -> int:
+    rendered = 0
+    for text in texts:
+        if text:
+            render_markdown(text)
+            rendered += 1
+    return rendered
+
+
 def markdown_filter(text: str) -> str:
     if not text:
         return ""
-    raw_html = markdown.markdown(
-        text, extensions=['fenced_code', 'codehilite'])
-    allowed_tags = list(bleach.sanitizer.ALLOWED_TAGS | {
-        'p', 'h1', 'h2', 'h3', 'h4', 'br', 'strong', 'em', 'ul', 'ol',
-        'li', 'a', 'code', 'pre', 'blockquote', 'span'
-    })
-    allowed_attrs = {
-        **bleach.sanitizer.ALLOWED_ATTRIBUTES,
-        'a': ['href', 'title', 'target'],
-        '*': ['class']
-    }
-    return bleach.clean(raw_html, tags=allowed_tags, attributes=allowed_attrs)
+    return render_markdown(text)
@@ -0,0 +1,103 @@
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, Optional, Type
+from limits.storage import Storage
+
+logger = logging.getLogger(__name__)
+
+SQLITE_SCHEME = "localsqlite"
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS rate_limits ("
+    "key TEXT PRIMARY KEY, count INTEGER NOT NULL, expires_at REAL NOT NULL) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS ix_rate_limits_expires_at ON rate_limits (expires_at)"
+)
+
+INCR_SQL = (
+    "INSERT INTO rate_limits (key, count, expires_at) VALUES (?1, ?2, ?3 + ?4) "
+    "ON CONFLICT(key) DO UPDATE SET "
+    "count = CASE WHEN expires_at <= ?3 THEN excluded.count ELSE count + excluded.count END, "
+    "expires_at = CASE WHEN expires_at <= ?3 THEN excluded.expires_at ELSE expires_at END "
+    "RETURNING count"
+)
+
+
+class SQLiteStorage(Storage):
+    STORAGE_SCHEME = [SQLITE_SCHEME]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, prune_interval: float = 30.0,
+                 busy_timeout: float = 5.0, **options: str):
+        self.path = uri.split("://", 1)[1] or ":memory:"
+        self.prune_interval = prune_interval
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._next_prune = 0.0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        conn = self._connect()
+        for statement in SCHEMA:
+            conn.execute(statement)
+
+    @property
+    def base_exceptions(self) -> Type[Exception]:
+        return sqlite3.Error
+
+    def _connect(self) -> sqlite3.Connection:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        if now < self._next_prune:
+            return
+        self._next_prune = now + self.prune_interval
+        try:
+            conn.execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+        except sqlite3.OperationalError as e:
+            logger.warning(f"⚠️ Rate Limit Prune Skipped: {e}")
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.time()
+        conn = self._connect()
+        self._prune(conn, now)
+        return conn.execute(INCR_SQL, (key, amount, now, expiry)).fetchone()[0]
+
+    def get(self, key: str) -> int:
+        row = self._connect().execute(
+            "SELECT count FROM rate_limits WHERE key = ? AND expires_at > ?", (key, time.time())).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        row = self._connect().execute(
+            "SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?", (key, now)).fetchone()
+        return row[0] if row else now
+
+    def check(self) -> bool:
+        try:
+            self._connect().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> Optional[int]:
+        return self._connect().execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        self._connect().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        rows, active = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(expires_at > ?), 0) FROM rate_limits", (time.time(),)).fetchone()
+        return {"path": self.path, "rows": rows, "active": active}
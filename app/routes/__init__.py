@@ -1,5 +1,7 @@
+from ..assets import assets_bp
 from .routes import main_bp
 
 
 def register_routes(app):
+    app.register_blueprint(assets_bp)
     app.register_blueprint(main_bp)
@@ -1,13 +1,18 @@
 import uuid
+import json
 import logging
 from datetime import datetime
-from flask import Blueprint, render_template, request, flash, current_app, session, abort, jsonify
+from flask import (
+    Blueprint, Response, render_template, request, flash, current_app, session,
+    abort, jsonify, stream_with_context
+)
+from ..cache import cached_page
 from ..essential import limiter
 from ..db import (
     get_user_profile, get_timeline, get_services, get_interests, get_stats,
     load_json_data, get_all_projects, get_all_posts, get_all_certifications,
     save_contact_message, get_all_skills, get_core_principles,
-    get_core_philosophy
+    get_core_philosophy, get_item_by_slug
 )
 
 logger = logging.getLogger(__name__)
@@ -15,9 +20,8 @@ logger = logging.getLogger(__name__)
 main_bp = Blueprint('main', __name__)
 
 
-def _get_item_or_404(items, slug):
-    item = next((i for i in items if getattr(i, 'slug', None) == slug), None)
-    return item or abort(404)
+def _get_item_or_404(collection, slug):
+    return get_item_by_slug(collection, slug) or abort(404)
 
 
 @main_bp.app_context_processor
@@ -34,17 +38,19 @@ def inject_globals():
         "socials": socials,
         "current_year": datetime.now().year,
         "profile": user_data,
-        "user_profile": get_user_profile(),
+        "user_profile": user_data,
         "stats": get_stats()
     }
 
 
 @main_bp.route('/')
+@cached_page
 def home():
     return render_template('home.html')
 
 
 @main_bp.route('/about')
+@cached_page
 def about():
     return render_template('about.html',
                            academic_timeline=get_timeline('academic'),
@@ -55,6 +61,7 @@ def about():
 
 
 @main_bp.route('/skills')
+@cached_page
 def skills():
     return render_template('skills.html', skills=get_all_skills(),
                            core_principles=get_core_principles(),
@@ -62,11 +69,13 @@ def skills():
 
 
 @main_bp.route('/resume')
+@cached_page
 def resume_page():
     return render_template('resume.html', **load_json_data())
 
 
 @main_bp.route('/resume_print')
+@cached_page
 def resume_detail():
     return render_template('resume_detail.html', **load_json_data())
 
@@ -85,35 +94,41 @@ def contact():
 
 
 @main_bp.route('/projects')
+@cached_page
 def projects():
     return render_template('projects.html', projects=get_all_projects())
 
 
 @main_bp.route('/project/<slug>')
+@cached_page
 def project_detail(slug):
-    project = _get_item_or_404(get_all_projects(), slug)
+    project = _get_item_or_404('projects', slug)
     return render_template('project_detail.html', project=project)
 
 
 @main_bp.route('/blogs')
+@cached_page
 def blogs():
     return render_template('blogs.html', posts=get_all_posts())
 
 
 @main_bp.route('/blog/<slug>')
+@cached_page
 def blog_detail(slug):
-    post = _get_item_or_404(get_all_posts(), slug)
+    post = _get_item_or_404('blog_posts', slug)
     return render_template('blog_detail.html', post=post)
 
 
 @main_bp.route('/certificates')
+@cached_page
 def certificates():
     return render_template('certificate.html', certifications=get_all_certifications())
 
 
 @main_bp.route('/certificate/<slug>')
+@cached_page
 def certificate_detail(slug):
-    cert = _get_item_or_404(get_all_certifications(), slug)
+    cert = _get_item_or_404('certifications', slug)
     return render_template('certificate_detail.html', cert=cert)
 
 
@@ -129,19 +144,63 @@ def get_status():
     return jsonify({"status": assistant.status if assistant else "offline"})
 
 
+def _read_chat_message():
+    user_input = (request.get_json(silent=True) or {}).get('message', '').strip()
+    if not user_input:
+        return None, (jsonify({"response": "I didn't Catch that."}), 400)
+    if len(user_input) > 500:
+        return None, (jsonify({"response": "Your Message is too Long. Please Keep it under 500 Characters."}), 400)
+    return user_input, None
+
+
+def _get_assistant_service():
+    service = getattr(current_app, 'assistant',
+                      getattr(current_app, 'bot', None))
+    if not service:
+        raise Exception("AI Assistant Service not Initialized")
+    return service
+
+
+def _sse(event: str, payload: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+
+@main_bp.route('/get_response_stream', methods=['POST'])
+@limiter.limit("15 per minute")
+def get_response_stream():
+    user_input, error = _read_chat_message()
+    if error:
+        return error
+    session_id = session.get('session_id', str(uuid.uuid4()))
+
+    def generate():
+        try:
+            service = _get_assistant_service()
+            for event in service.stream_response(user_input, session_id=session_id):
+                if "delta" in event:
+                    yield _sse("token", {"text": event["delta"]})
+                elif "error" in event:
+                    yield _sse("error", {"error": event["error"], "status": event.get('status')})
+                else:
+                    yield _sse("done", {"response": event.get('reply'), "status": event.get('status')})
+        except Exception as e:
+            logger.error(f"❌ Chat Stream Error: {e}")
+            yield _sse("done", {"response": "System is Temporarily Unavailable.", "status": "offline"})
+
+    return Response(stream_with_context(generate()), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
+
 @main_bp.route('/get_response', methods=['POST'])
 @limiter.limit("15 per minute")
 def get_response():
-    user_input = request.json.get('message', '').strip()
-    if not user_input:
-        return jsonify({"response": "I didn't Catch that."}), 400
-    if len(user_input) > 500:
-        return jsonify({"response": "Your Message is too Long. Please Keep it under 500 Characters."}), 400
+    user_input, error = _read_chat_message()
+    if error:
+        return error
     try:
-        service = getattr(current_app, 'assistant',
-                          getattr(current_app, 'bot', None))
-        if not service:
-            raise Exception("AI Assistant Service not Initialized")
+        service = _get_assistant_service()
         session_id = session.get('session_id', str(uuid.uuid4()))
         result = service.get_response(user_input, session_id=session_id)
         return jsonify({
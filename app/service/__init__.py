@@ -1 +1,2 @@
-from .service import initialize_app_services, run_server
\ No newline at end of file
+from .service import initialize_app_services, start_background_tasks, run_server
+from .scheduler import Scheduler, scheduler, init_scheduler
\ No newline at end of file
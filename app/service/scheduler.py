@@ -0,0 +1,158 @@
+import os
+import time
+import atexit
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from flask import Flask
+from ..cache import get_lease_owner
+from ..config import Config
+from ..db import acquire_lease, prune_database
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    name: str
+    interval: float
+    fn: Callable[[], Any]
+    next_run: float = 0.0
+    runs: int = 0
+    skipped: int = 0
+    failures: int = 0
+    last_duration: float = 0.0
+    last_error: Optional[str] = None
+    leader: bool = True
+
+
+class Scheduler:
+    def __init__(self, tick_seconds: float = 1.0):
+        self.tick_seconds = tick_seconds
+        self.jobs: Dict[str, Job] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def add_job(self, name: str, interval: float, fn: Callable[[], Any], initial_delay: float = 0.0,
+                leader: bool = True) -> Job:
+        job = Job(name, interval, fn, next_run=time.monotonic() + initial_delay, leader=leader)
+        with self._lock:
+            self.jobs[name] = job
+        return job
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            self._stop = threading.Event()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name="cache-scheduler", daemon=True)
+            self._thread.start()
+        logger.info(f"✅ Scheduler Started ({', '.join(self.jobs)})")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread and self._thread.is_alive() and self._pid == os.getpid():
+            self._thread.join(timeout)
+
+    def reset(self) -> None:
+        self._thread = None
+        self._pid = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_pending()
+            self._stop.wait(self.tick_seconds)
+
+    def run_pending(self) -> None:
+        now = time.monotonic()
+        for job in list(self.jobs.values()):
+            if job.next_run <= now and not self._stop.is_set():
+                self.run_job(job)
+
+    def run_job(self, job: Job) -> bool:
+        job.next_run = time.monotonic() + job.interval
+        if job.leader and not acquire_lease(f"job:{job.name}", get_lease_owner(), job.interval):
+            job.skipped += 1
+            return False
+        started = time.perf_counter()
+        try:
+            job.fn()
+            job.runs += 1
+            job.last_error = None
+            return True
+        except Exception as e:
+            job.failures += 1
+            job.last_error = str(e)
+            logger.error(f"❌ Scheduled Job Failed ({job.name}) - {e}")
+            return False
+        finally:
+            job.last_duration = time.perf_counter() - started
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "interval": job.interval,
+                "leader": job.leader,
+                "runs": job.runs,
+                "skipped": job.skipped,
+                "failures": job.failures,
+                "last_duration": round(job.last_duration, 3),
+                "last_error": job.last_error
+            }
+            for name, job in self.jobs.items()
+        }
+
+
+scheduler = Scheduler()
+atexit.register(scheduler.stop)
+
+
+def _refresh_github(app: Flask) -> None:
+    socials = getattr(app, 'socials', None)
+    github = getattr(socials, 'github', None)
+    if github and not github.static_projects:
+        github.sync()
+
+
+def _refresh_models(app: Flask) -> None:
+    from ..assistant.assistant_logic import _fetch_valid_models
+    assistant = getattr(app, 'assistant', None)
+    if assistant and assistant.logic.is_online:
+        _fetch_valid_models()
+
+
+def _refresh_context(app: Flask) -> None:
+    assistant = getattr(app, 'assistant', None)
+    if assistant and assistant.logic.is_online:
+        assistant.logic.refresh_context()
+
+
+def _sync_assistant(app: Flask) -> None:
+    assistant = getattr(app, 'assistant', None)
+    if assistant:
+        assistant.logic.sync_local_state()
+
+
+def init_scheduler(app: Flask) -> Optional[Scheduler]:
+    if not Config.SCHEDULER_ENABLED:
+        return None
+    scheduler.add_job("github", Config.SCHEDULER_GITHUB_INTERVAL,
+                      lambda: _refresh_github(app))
+    scheduler.add_job("models", Config.SCHEDULER_MODELS_INTERVAL,
+                      lambda: _refresh_models(app))
+    scheduler.add_job("context", Config.SCHEDULER_CONTEXT_INTERVAL,
+                      lambda: _refresh_context(app))
+    scheduler.add_job("prune", Config.SCHEDULER_PRUNE_INTERVAL,
+                      prune_database, initial_delay=60)
+    scheduler.add_job("assistant", Config.SCHEDULER_SYNC_INTERVAL,
+                      lambda: _sync_assistant(app), leader=False)
+    scheduler.start()
+    return scheduler
@@ -1,34 +1,84 @@
 import logging
+import threading
+from typing import Optional
 from flask import Flask
 from ..config import Config, get_config
-from ..essential import is_main_process
-from ..assistant import init_assistant
-from ..db import init_db
+from ..essential import is_main_process, warm_markdown_cache
+from ..assets import init_assets
+from ..assistant import init_assistant, get_query_router
+from ..db import init_db, load_content, get_all_posts, get_search_index
 from ..social import init_socials
+from ..setup.boot import BootReport
+from .scheduler import init_scheduler
 
 logger = logging.getLogger(__name__)
 
 
-def initialize_app_services(app: Flask) -> None:
+def _warm_markdown_in_background() -> None:
+    texts = [getattr(post, 'content', '') for post in get_all_posts()]
+    threading.Thread(target=warm_markdown_cache, args=(texts,),
+                     name="markdown-warmup", daemon=True).start()
+
+
+def preload_shared_state(app: Flask) -> None:
+    if Config.MARKDOWN_WARMUP:
+        warm_markdown_cache(getattr(post, 'content', '')
+                            for post in get_all_posts())
+    for template_name in app.jinja_env.list_templates(extensions=("html",)):
+        app.jinja_env.get_template(template_name)
+    get_search_index()
+    get_query_router()
+
+
+def start_background_tasks(app: Flask) -> None:
+    if Config.MARKDOWN_WARMUP and not Config.PRELOAD_APP:
+        _warm_markdown_in_background()
+    assistant = getattr(app, 'assistant', None)
+    if assistant:
+        assistant.logic.warm_up_in_background()
+    github = getattr(getattr(app, 'socials', None), 'github', None)
+    if github and not Config.SCHEDULER_ENABLED and not github.static_projects:
+        github.refresh_in_background()
+    app.scheduler = init_scheduler(app)
+
+
+def initialize_app_services(app: Flask, report: Optional[BootReport] = None) -> None:
+    report = report or BootReport()
     with app.app_context():
         should_init = Config.IS_RENDER or is_main_process() or not app.debug
         if should_init:
             try:
                 logger.info("✅ Initializing the Service")
-                if app.debug or Config.IS_RENDER:
-                    app.database = init_db()
-                app.assistant = init_assistant()
-                app.socials = init_socials()
+                with report.phase("content"):
+                    load_content()
+                with report.phase("assets"):
+                    init_assets()
+                with report.phase("db"):
+                    if app.debug or Config.IS_RENDER:
+                        app.database = init_db()
+                with report.phase("assistant"):
+                    app.assistant = init_assistant()
+                with report.phase("socials"):
+                    app.socials = init_socials()
+                if Config.PRELOAD_APP:
+                    with report.phase("preload"):
+                        preload_shared_state(app)
+                    app.scheduler = None
+                else:
+                    with report.phase("background"):
+                        start_background_tasks(app)
                 logger.info("✅ Service Initialized Successfully")
             except Exception as e:
                 logger.warning(f"⚠️ Service Initialization Warning  {e}")
                 app.database = getattr(app, 'database', None)
                 app.assistant = getattr(app, 'assistant', None)
                 app.socials = getattr(app, 'socials', None)
+                app.scheduler = getattr(app, 'scheduler', None)
         else:
             app.database = None
             app.assistant = None
             app.socials = None
+            app.scheduler = None
 
 
 def run_server(app):
@@ -1 +1,2 @@
+from .boot import BootReport
 from .setup import setup_app, configure_logging
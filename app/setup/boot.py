@@ -0,0 +1,38 @@
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class BootReport:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(
+                name, 0.0) + time.perf_counter() - started
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+    def as_dict(self) -> Dict[str, float]:
+        report = {name: round(seconds * 1000, 1)
+                  for name, seconds in self.phases.items()}
+        report["total"] = round(self.total * 1000, 1)
+        return report
+
+    def summary(self) -> str:
+        return " | ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.phases.items())
+
+    def log(self) -> None:
+        logger.info(
+            f"✅ Boot Completed in {self.total * 1000:.0f}ms ({self.summary()})")
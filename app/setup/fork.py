@@ -0,0 +1,33 @@
+import logging
+from typing import Optional
+from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+
+def reset_after_fork(app: Optional[Flask] = None) -> None:
+    from ..assistant import model_router
+    from ..assistant.assistant_logic import AssistantCoreLogic
+    from ..cache import single_flight
+    from ..db import batch_writer, engine
+    from ..service import scheduler, start_background_tasks
+    from ..social import http_client
+    engine.dispose(close=False)
+    AssistantCoreLogic.reset_shared_client()
+    http_client.reset(close=False)
+    batch_writer.reset()
+    model_router.reset()
+    single_flight.reset()
+    scheduler.reset()
+    if app is not None:
+        with app.app_context():
+            start_background_tasks(app)
+
+
+def shutdown_worker() -> None:
+    from ..db import batch_writer
+    from ..service import scheduler
+    scheduler.stop()
+    if not batch_writer.flush():
+        logger.warning("⚠️ Write Queue Not Drained Before Worker Exit")
+    batch_writer.stop()
@@ -1,7 +1,11 @@
 import logging
 import flask.cli
+from typing import Optional
 from flask import Flask
+from ..assets import asset_url, asset_srcset
+from ..cache import compress_response
 from ..essential import markdown_filter, format_date, limiter
+from .boot import BootReport
 
 logger = logging.getLogger(__name__)
 
@@ -22,15 +26,21 @@ def configure_logging():
         flask.cli.show_server_banner = lambda *args: None
 
 
-def setup_app(app: Flask):
-    from ..config import get_config
-    from ..db import init_db_session
-    from ..routes import register_routes
-    from ..service import initialize_app_services
-    app.config.from_object(get_config())
-    limiter.init_app(app)
-    register_routes(app)
-    app.jinja_env.filters['markdown'] = markdown_filter
-    app.jinja_env.filters['format_date'] = format_date
-    initialize_app_services(app)
+def setup_app(app: Flask, report: Optional[BootReport] = None):
+    report = report or BootReport()
+    with report.phase("import"):
+        from ..config import get_config
+        from ..db import init_db_session
+        from ..routes import register_routes
+        from ..service import initialize_app_services
+    with report.phase("config"):
+        app.config.from_object(get_config())
+        limiter.init_app(app)
+        app.after_request(compress_response)
+        register_routes(app)
+        app.jinja_env.filters['markdown'] = markdown_filter
+        app.jinja_env.filters['format_date'] = format_date
+        app.jinja_env.globals.update(
+            asset_url=asset_url, asset_srcset=asset_srcset)
+    initialize_app_services(app, report)
     init_db_session(app)
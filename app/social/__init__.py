@@ -2,3 +2,4 @@ from .socials import init_socials, SocialServices
 from .github import GitHubPortfolio
 from .linkedin import LinkedInPortfolio
 from .contact import ContactInfo
+from .http_client import HttpClient, http_client
@@ -1,15 +1,14 @@
 import logging
 from typing import Dict
 from ..config import Config
-from ..utils import load_json_file
+from ..db.content import get_social_section
 
 logger = logging.getLogger(__name__)
 
 
 class ContactInfo:
     def __init__(self):
-        social_data = load_json_file(
-            "app", "social", "social.json").get("contact", {})
+        social_data = get_social_section("contact")
         self.phone = social_data.get("phone") or Config.CONTACT_PHONE
         self.email = social_data.get("email") or Config.CONTACT_EMAIL
 
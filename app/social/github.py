@@ -1,67 +1,189 @@
+import time
 import logging
+import threading
 import requests
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Set
+from ..cache import single_flight
 from ..config import Config
-from ..db import get_cached_github_data, set_cached_github_data, CacheKeys
-from ..utils import load_json_file
+from ..db import get_cached_github_data, set_cached_github_data, get_github_snapshot, CacheKeys
+from ..db.content import get_social_section
+from .http_client import http_client
 
 logger = logging.getLogger(__name__)
 
 
 class GitHubPortfolio:
+    _refreshing: Set[str] = set()
+    _retry_after: Dict[str, float] = {}
+    _rate_limit: Dict[str, Any] = {"remaining": None, "reset": 0}
+    _stats: Dict[str, int] = {"requests": 0, "not_modified": 0, "refreshes": 0, "failures": 0}
+    _lock = threading.Lock()
+
     def __init__(self):
-        social_data = load_json_file(
-            "app", "social", "social.json").get("github", {})
+        social_data = get_social_section("github")
         self.username: str = social_data.get(
             "username") or Config.GITHUB_USERNAME
         self.token: str = social_data.get("token") or Config.GITHUB_TOKEN
-        self.base_url: str = f"https://api.github.com/users/{self.username}/repos"
+        self.api_url: str = Config.GITHUB_API_URL.rstrip("/")
+        self.base_url: str = f"{self.api_url}/users/{self.username}/repos"
+        self.cache_key: str = f"{CacheKeys.GITHUB_REPOS}_{self.username}"
 
     def get_projects(self, limit: int = 12, sort_by: str = "stars") -> List[Dict[str, Any]]:
         if not self.username:
             return []
-        social_data = load_json_file(
-            "app", "social", "social.json").get("github", {})
-        json_projects = social_data.get("projects")
-        if json_projects and isinstance(json_projects, list):
-            return json_projects[:limit]
-        cache_key = f"{CacheKeys.GITHUB_REPOS}_{self.username}_{limit}_{sort_by}"
-        cached_data = get_cached_github_data(cache_key)
-        if cached_data:
-            return cached_data
+        json_projects = self.static_projects
+        if json_projects:
+            return list(json_projects[:limit])
+        snapshot = get_github_snapshot(self.cache_key)
+        if snapshot is None:
+            data = self._sync_once()
+        else:
+            data, stored_at = snapshot
+            if time.time() - stored_at >= Config.GITHUB_CACHE_TTL:
+                self.refresh_in_background()
+        return self._select(data, limit, sort_by)
+
+    @property
+    def static_projects(self) -> Optional[tuple]:
+        json_projects = get_social_section("github").get("projects")
+        return json_projects if isinstance(json_projects, tuple) else None
+
+    @staticmethod
+    def _select(data: Optional[Dict[str, Any]], limit: int, sort_by: str) -> List[Dict[str, Any]]:
+        if not data:
+            return []
+        projects = [repo for page in data.get("pages", [])
+                    for repo in page.get("repos", [])]
+        if sort_by == "stars":
+            projects.sort(key=lambda x: x.get("stars", 0), reverse=True)
+        return [dict(project) for project in projects[:limit]]
+
+    def refresh_in_background(self) -> bool:
+        with self._lock:
+            if self.cache_key in self._refreshing or time.time() < self._retry_after.get(self.cache_key, 0):
+                return False
+            self._refreshing.add(self.cache_key)
+        threading.Thread(target=self._background_refresh,
+                         name="github-refresh", daemon=True).start()
+        return True
+
+    def _background_refresh(self) -> None:
+        try:
+            self._sync_once()
+        finally:
+            with self._lock:
+                self._refreshing.discard(self.cache_key)
+
+    def _sync_once(self) -> Optional[Dict[str, Any]]:
+        return single_flight.do(
+            self.cache_key,
+            self.sync,
+            lookup=lambda: get_cached_github_data(
+                self.cache_key, Config.GITHUB_CACHE_TTL),
+            lease_seconds=Config.SINGLE_FLIGHT_LEASE
+        )
+
+    @classmethod
+    def _count(cls, key: str) -> None:
+        with cls._lock:
+            cls._stats[key] += 1
+
+    def _set_retry_after(self, retry_at: Optional[float]) -> None:
+        with self._lock:
+            if retry_at is None:
+                self._retry_after.pop(self.cache_key, None)
+            else:
+                self._retry_after[self.cache_key] = retry_at
+
+    def sync(self) -> Optional[Dict[str, Any]]:
+        snapshot = get_github_snapshot(self.cache_key)
+        previous = snapshot[0] if snapshot else None
+        with self._lock:
+            remaining, reset_at = self._rate_limit["remaining"], self._rate_limit["reset"]
+        if remaining == 0 and time.time() < reset_at:
+            logger.warning("⚠️ GitHub Rate Limit Exhausted - Serving Stale Data")
+            self._set_retry_after(reset_at)
+            return previous
+        known_pages = {page["url"]: page for page in (
+            previous or {}).get("pages", [])}
+        url: Optional[str] = f"{self.base_url}?per_page={Config.GITHUB_PER_PAGE}"
+        pages: List[Dict[str, Any]] = []
         try:
-            headers = {"Accept": "application/vnd.github.v3+json"}
-            if self.token:
-                headers["Authorization"] = f"token {self.token}"
-            response = requests.get(self.base_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            repos = response.json()
-            my_repos = [repo for repo in repos if not repo.get("fork", False)]
-            if sort_by == "stars":
-                my_repos.sort(key=lambda x: x.get(
-                    "stargazers_count", 0), reverse=True)
-            projects = []
-            for r in my_repos:
-                try:
-                    updated_str = datetime.strptime(
-                        r.get("pushed_at", ""), "%Y-%m-%dT%H:%M:%SZ"
-                    ).strftime("%b %d, %Y")
-                except Exception:
-                    updated_str = "Unknown"
-                projects.append({
-                    "name": r.get("name", "Unknown"),
-                    "description": r.get("description") or "No description provided.",
-                    "language": r.get("language") or "Code",
-                    "stars": r.get("stargazers_count", 0),
-                    "url": r.get("html_url", "#"),
-                    "updated_at": updated_str
-                })
-            final_projects = projects[:limit]
-            set_cached_github_data(cache_key, final_projects)
-            return final_projects
+            while url and len(pages) < Config.GITHUB_MAX_PAGES:
+                page = self._fetch_page(url, known_pages.get(url))
+                pages.append(page)
+                url = page.get("next")
         except requests.exceptions.RequestException as e:
             logger.error(f"⚠️ GitHub API Network Error: {e}")
+            return self._sync_failed(previous)
         except Exception as e:
             logger.error(f"⚠️ GitHub Data Processing Error: {e}")
-        return []
+            return self._sync_failed(previous)
+        data = {"pages": pages}
+        set_cached_github_data(self.cache_key, data)
+        self._set_retry_after(None)
+        self._count("refreshes")
+        return data
+
+    def _sync_failed(self, previous: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        self._count("failures")
+        self._set_retry_after(time.time() + Config.GITHUB_RETRY_SECONDS)
+        return previous
+
+    def _headers(self, known_page: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        headers = {"Accept": "application/vnd.github.v3+json"}
+        if self.token:
+            headers["Authorization"] = f"token {self.token}"
+        if known_page:
+            if known_page.get("etag"):
+                headers["If-None-Match"] = known_page["etag"]
+            if known_page.get("last_modified"):
+                headers["If-Modified-Since"] = known_page["last_modified"]
+        return headers
+
+    def _fetch_page(self, url: str, known_page: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        response = http_client.get(url, headers=self._headers(known_page))
+        self._count("requests")
+        if response.status_code == 304 and known_page:
+            self._count("not_modified")
+            return known_page
+        self._track_rate_limit(response)
+        response.raise_for_status()
+        return {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "next": response.links.get("next", {}).get("url"),
+            "repos": [self._to_project(r) for r in response.json() if not r.get("fork", False)]
+        }
+
+    def _track_rate_limit(self, response: requests.Response) -> None:
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            reset_at = float(response.headers.get("X-RateLimit-Reset", 0) or 0)
+            with self._lock:
+                self._rate_limit["remaining"] = int(remaining)
+                self._rate_limit["reset"] = reset_at
+
+    @staticmethod
+    def _to_project(r: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            updated_str = datetime.strptime(
+                r.get("pushed_at", ""), "%Y-%m-%dT%H:%M:%SZ"
+            ).strftime("%b %d, %Y")
+        except Exception:
+            updated_str = "Unknown"
+        return {
+            "name": r.get("name", "Unknown"),
+            "description": r.get("description") or "No description provided.",
+            "language": r.get("language") or "Code",
+            "stars": r.get("stargazers_count", 0),
+            "url": r.get("html_url", "#"),
+            "updated_at": updated_str
+        }
+
+    @classmethod
+    def get_sync_stats(cls) -> Dict[str, Any]:
+        with cls._lock:
+            return {**cls._stats, "rate_limit_remaining": cls._rate_limit["remaining"]}
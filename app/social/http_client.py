@@ -0,0 +1,165 @@
+import os
+import time
+import random
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class HttpClient:
+    def __init__(self, pool_maxsize: int = 8, pool_block: bool = True, max_retries: int = 3,
+                 backoff_seconds: float = 0.5, max_backoff_seconds: float = 8.0,
+                 time_budget: float = 15.0, timeout: Tuple[float, float] = (3.05, 10.0)):
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.time_budget = time_budget
+        self.timeout = timeout
+        self._sessions: Dict[str, requests.Session] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def _session(self, host: str) -> requests.Session:
+        with self._lock:
+            if self._pid != os.getpid():
+                self._sessions = {}
+                self._pid = os.getpid()
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method: str, url: str, budget: Optional[float] = None, **kwargs: Any) -> requests.Response:
+        host = urlsplit(url).netloc
+        session = self._session(host)
+        deadline = time.monotonic() + (budget or self.time_budget)
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise requests.exceptions.Timeout(
+                    f"Time Budget Exhausted for {host}")
+            kwargs["timeout"] = tuple(min(t, remaining) for t in self.timeout)
+            started = time.perf_counter()
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self._record(host, time.perf_counter() - started, None)
+                delay = self._backoff(attempt)
+                if attempt >= self.max_retries or time.monotonic() + delay >= deadline:
+                    raise
+                logger.warning(f"⚠️ Retrying {host} After Network Error: {e}")
+                self._sleep(host, delay)
+                attempt += 1
+                continue
+            self._record(host, time.perf_counter() - started, response.status_code)
+            if attempt < self.max_retries and self._should_retry(response):
+                delay = self._retry_delay(response, attempt)
+                if time.monotonic() + delay < deadline:
+                    logger.warning(
+                        f"⚠️ Retrying {host} After HTTP {response.status_code}")
+                    response.close()
+                    self._sleep(host, delay)
+                    attempt += 1
+                    continue
+            return response
+
+    @staticmethod
+    def _should_retry(response: requests.Response) -> bool:
+        if response.status_code in RETRY_STATUSES:
+            return True
+        if response.status_code == 403:
+            return bool(response.headers.get("Retry-After")) or \
+                response.headers.get("X-RateLimit-Remaining") == "0" or \
+                "secondary rate limit" in response.text.lower()
+        return False
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = response.headers.get("X-RateLimit-Reset", "")
+            if reset.isdigit():
+                return max(0.0, float(reset) - time.time())
+        return self._backoff(attempt)
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff_seconds, self.backoff_seconds * 2 ** attempt))
+
+    def _sleep(self, host: str, delay: float) -> None:
+        with self._lock:
+            self._host_stats(host)["retries"] += 1
+        time.sleep(delay)
+
+    def _host_stats(self, host: str) -> Dict[str, Any]:
+        return self._stats.setdefault(host, {
+            "requests": 0, "errors": 0, "retries": 0, "latency_total": 0.0, "last_status": None
+        })
+
+    def _record(self, host: str, latency: float, status: Optional[int]) -> None:
+        with self._lock:
+            stats = self._host_stats(host)
+            stats["requests"] += 1
+            stats["latency_total"] += latency
+            stats["last_status"] = status
+            if status is None or status >= 500 or status == 429:
+                stats["errors"] += 1
+
+    @staticmethod
+    def _connections(session: Optional[requests.Session]) -> int:
+        if session is None:
+            return 0
+        pools = session.get_adapter("http://").poolmanager.pools
+        return sum(getattr(pools.get(key), "num_connections", 0) for key in pools.keys())
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                host: {
+                    "requests": s["requests"],
+                    "errors": s["errors"],
+                    "retries": s["retries"],
+                    "connections": self._connections(self._sessions.get(host)),
+                    "avg_latency_ms": round(s["latency_total"] / s["requests"] * 1000, 1) if s["requests"] else 0.0,
+                    "last_status": s["last_status"]
+                }
+                for host, s in self._stats.items()
+            }
+
+    def reset(self, close: bool = True) -> None:
+        self._lock = threading.Lock()
+        sessions, self._sessions = self._sessions, {}
+        self._pid = os.getpid()
+        if close:
+            for session in sessions.values():
+                session.close()
+
+
+http_client = HttpClient(
+    pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+    max_retries=Config.HTTP_MAX_RETRIES,
+    time_budget=Config.HTTP_TIME_BUDGET,
+    timeout=(Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT)
+)
@@ -2,18 +2,18 @@ import logging
 from typing import Dict, List, Any
 from ..config import Config
 from ..db import load_json_data
-from ..utils import load_json_file
+from ..db.content import get_social_section, thaw
 
 logger = logging.getLogger(__name__)
 
 
 class LinkedInPortfolio:
     def __init__(self):
-        social_data = load_json_file(
-            "app", "social", "social.json").get("linkedin", {})
+        social_data = get_social_section("linkedin")
         self.username: str = social_data.get(
             "username") or Config.LINKEDIN_USERNAME
-        self.data: Dict[str, Any] = load_json_data().get("user_profile", {})
+        self.data: Dict[str, Any] = thaw(
+            load_json_data().get("user_profile", {}))
         self.profile: Dict[str, Any] = self.data.get("linkedin_profile", {})
         self.experience: List[Dict[str, Any]] = self.profile.get(
             "experience", []) if self.profile else []
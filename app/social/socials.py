@@ -17,10 +17,6 @@ class SocialServices:
         try:
             temp_gh = GitHubPortfolio()
             if getattr(temp_gh, 'username', None):
-                try:
-                    temp_gh.get_projects(limit=12, sort_by="stars")
-                except Exception as ge:
-                    logger.warning(f"⚠️ GitHub Startup Fetch Failed: {ge}")
                 return temp_gh
         except Exception as e:
             logger.error(f"❌ Failed to Load GitHub: {e}")
@@ -143,23 +143,49 @@ function addMessage(text, sender, isTypingIndicator = false) {
     if (isTypingIndicator) {
         bubble.innerHTML = `<span class="typing-text">Typing<span class="typing-dots"><span></span><span></span><span></span></span></span>`;
     } else {
-        const safeText = String(text || "");
-        let formatted = safeText.replace(/\*\*(.*?)\*\*/g, '<b>$1</b>').replace(/\n/g, '<br>');
-
-        formatted = formatted.replace(
-            /(?<!href=["'])(?<!src=["'])(\b(https?|ftp):\/\/[-A-Z0-9+&@#\/%?=~_|!:,.;]*[-A-Z0-9+&@#\/%=~_|])/gim,
-            '<a href="$1" target="_blank" class="chat-link">$1</a>'
-        );
-        formatted = formatted.replace(
-            /(?<!href=["'])(?<!src=["'])(^|[^\/])(www\.[-A-Z0-9+&@#\/%?=~_|!:,.;]*[-A-Z0-9+&@#\/%=~_|])/gim,
-            '$1<a href="https://$2" target="_blank" class="chat-link">$2</a>'
-        );
-        bubble.innerHTML = formatted;
+        bubble.innerHTML = formatMessage(text);
     }
     container.appendChild(avatar);
     container.appendChild(bubble);
     body.appendChild(container);
     body.scrollTop = body.scrollHeight;
+    return bubble;
+}
+
+function formatMessage(text) {
+    const safeText = String(text || "");
+    let formatted = safeText.replace(/\*\*(.*?)\*\*/g, '<b>$1</b>').replace(/\n/g, '<br>');
+
+    formatted = formatted.replace(
+        /(?<!href=["'])(?<!src=["'])(\b(https?|ftp):\/\/[-A-Z0-9+&@#\/%?=~_|!:,.;]*[-A-Z0-9+&@#\/%=~_|])/gim,
+        '<a href="$1" target="_blank" class="chat-link">$1</a>'
+    );
+    formatted = formatted.replace(
+        /(?<!href=["'])(?<!src=["'])(^|[^\/])(www\.[-A-Z0-9+&@#\/%?=~_|!:,.;]*[-A-Z0-9+&@#\/%=~_|])/gim,
+        '$1<a href="https://$2" target="_blank" class="chat-link">$2</a>'
+    );
+    return formatted;
+}
+
+function updateStreamingBubble(bubble, text) {
+    const body = document.getElementById("chat-body");
+    bubble.innerHTML = formatMessage(text);
+    if (body) body.scrollTop = body.scrollHeight;
+}
+
+function parseStreamEvent(raw) {
+    let event = "message";
+    const dataLines = [];
+    raw.split("\n").forEach((line) => {
+        if (line.startsWith("event:")) event = line.slice(6).trim();
+        else if (line.startsWith("data:")) dataLines.push(line.slice(5).trim());
+    });
+    if (!dataLines.length) return null;
+    try {
+        return { event, data: JSON.parse(dataLines.join("\n")) };
+    } catch (e) {
+        return null;
+    }
 }
 
 function showTyping() {
@@ -179,6 +205,86 @@ function calculateTypingDelay(text) {
     return Math.min(Math.max(safeText.length * perChar, base), max);
 }
 
+async function streamResponse(text) {
+    const response = await fetch("/get_response_stream", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ message: text }),
+    });
+    if (!response.ok || !response.body || typeof TextDecoder === "undefined") {
+        throw new Error("Stream Unavailable");
+    }
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    let streamed = "";
+    let bubble = null;
+    let finalData = null;
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let boundary;
+        while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+            const parsed = parseStreamEvent(buffer.slice(0, boundary));
+            buffer = buffer.slice(boundary + 2);
+            if (!parsed) continue;
+            if (parsed.event === "token") {
+                streamed += parsed.data.text || "";
+                if (!bubble) {
+                    hideTyping();
+                    bubble = addMessage(streamed, "bot");
+                } else {
+                    updateStreamingBubble(bubble, streamed);
+                }
+            } else if (parsed.event === "done") {
+                finalData = parsed.data;
+            }
+        }
+    }
+    if (!finalData) {
+        const error = new Error("Stream Interrupted");
+        error.bubble = bubble;
+        throw error;
+    }
+    return { bubble, data: finalData };
+}
+
+async function fetchResponse(text) {
+    const response = await fetch("/get_response", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ message: text }),
+    });
+    if (!response.ok) throw new Error("Offline");
+    return response.json();
+}
+
+function finishProcessing(status) {
+    updateBotUI(status);
+    isProcessing = false;
+    document.getElementById("user-input").focus();
+}
+
+function renderResponse(data) {
+    let finalResponse = data.response;
+    if (data.status === "refused") {
+        finalResponse = "**My Apologize!!**\nPlease Try Asking about **Krishna Verma**\nI've Strictly Instructed to Showcase his **Data** and **Info**!\nI don't Know Anything about the **General Query**!!";
+    }
+    const delay = calculateTypingDelay(finalResponse);
+    setTimeout(() => {
+        hideTyping();
+        addMessage(finalResponse, "bot");
+        finishProcessing(data.status);
+    }, delay);
+}
+
+function renderOffline() {
+    hideTyping();
+    addMessage("⚠️ System Offline.", "bot");
+    finishProcessing("offline");
+}
+
 async function handleSend() {
     const input = document.getElementById("user-input");
     const text = input.value.trim();
@@ -188,31 +294,24 @@ async function handleSend() {
     isProcessing = true;
     showTyping();
     try {
-        const response = await fetch("/get_response", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({ message: text }),
-        });
-        if (!response.ok) throw new Error("Offline");
-        const data = await response.json();
-        let finalResponse = data.response;
-        if (data.status === "refused") {
-            finalResponse = "**My Apologize!!**\nPlease Try Asking about **Krishna Verma**\nI've Strictly Instructed to Showcase his **Data** and **Info**!\nI don't Know Anything about the **General Query**!!";
+        const { bubble, data } = await streamResponse(text);
+        if (bubble) {
+            updateStreamingBubble(bubble, data.response);
+            finishProcessing(data.status);
+        } else {
+            renderResponse(data);
         }
-        const delay = calculateTypingDelay(finalResponse);
-        setTimeout(() => {
-            hideTyping();
-            addMessage(finalResponse, "bot");
-            updateBotUI(data.status);
-            isProcessing = false;
-            document.getElementById("user-input").focus();
-        }, delay);
+        return;
     } catch (e) {
-        hideTyping();
-        addMessage("⚠️ System Offline.", "bot");
-        updateBotUI("offline");
-        isProcessing = false;
-        document.getElementById("user-input").focus();
+        if (e.bubble) {
+            finishProcessing("offline");
+            return;
+        }
+    }
+    try {
+        renderResponse(await fetchResponse(text));
+    } catch (e) {
+        renderOffline();
     }
 }
 
@@ -0,0 +1,36 @@
+import gc
+import os
+import time
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+preload_app = str(os.getenv("PRELOAD_APP", "True")).lower() in ("true", "1", "yes", "t")
+os.environ["PRELOAD_APP"] = str(preload_app)
+
+_forked_at = {}
+
+
+def when_ready(server):
+    if preload_app:
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    _forked_at[worker.pid] = time.perf_counter()
+    if preload_app:
+        from app.setup.fork import reset_after_fork
+        reset_after_fork(worker.app.wsgi())
+
+
+def post_worker_init(worker):
+    started = _forked_at.pop(worker.pid, None)
+    if started is not None:
+        worker.log.info(f"✅ Worker {worker.pid} Ready in {(time.perf_counter() - started) * 1000:.0f}ms")
+
+
+def worker_exit(server, worker):
+    from app.setup.fork import shutdown_worker
+    shutdown_worker()
@@ -0,0 +1,88 @@
+import os
+import json
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+import pytest
+
+os.environ.setdefault("PORT", "5000")
+os.environ.setdefault("FLASK_SECRET_KEY", "test")
+os.environ.setdefault("USE_SQLITE_LOCALLY", "true")
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+os.environ.setdefault("DB_WRITE_BEHIND", "false")
+os.environ.setdefault("INTERNAL_DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'portfolio_test.db')}")
+
+Reply = Tuple[int, Dict[str, str], Any]
+
+
+class FakeServer:
+    def __init__(self):
+        self.routes: Dict[str, List[Reply]] = {}
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        self.connections = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def add(self, path: str, *replies: Reply) -> None:
+        self.routes[path] = list(replies)
+
+    def requests_for(self, path: str) -> List[Dict[str, str]]:
+        return [headers for request_path, headers in self.requests
+                if request_path == path or request_path.split("?", 1)[0] == path]
+
+    def _reply(self, path: str) -> Optional[Reply]:
+        replies = self.routes.get(path) or self.routes.get(path.split("?", 1)[0])
+        if not replies:
+            return None
+        return replies.pop(0) if len(replies) > 1 else replies[0]
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                fake.connections += 1
+
+            def do_GET(self):
+                fake.requests.append((self.path, dict(self.headers)))
+                reply = fake._reply(self.path) or (404, {}, {"message": "Not Found"})
+                status, headers, body = reply
+                payload = b"" if body is None else (
+                    body.encode() if isinstance(body, str) else json.dumps(body).encode())
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value.replace("{url}", fake.url))
+                self.send_header("Content-Length", str(len(payload)))
+                if body is not None:
+                    self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def fake_server():
+    server = FakeServer()
+    server.thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+@pytest.fixture(scope="session")
+def database():
+    from app.db import engine, run_migrations
+    run_migrations(engine)
+    return engine
@@ -0,0 +1,105 @@
+from typing import List, Optional
+from app.assistant.assistant_query import (
+    KeywordMatcher, FuzzyMatcher, QueryRouter, global_reply_key, QUICK, CACHED, REFUSE, LLM
+)
+
+VERSION = "test-version"
+
+QUICK_RESPONSES = {
+    "Who are you?": "I am the assistant.",
+    "What is his tech stack?": "Python and Flask.",
+    "Tell me about his projects.": "Three featured projects.",
+}
+
+KEYWORDS = ["krishna", "python", "flask", "java", "sql", "tech stack", "stack", "game logic",
+            "logic", "c++", "Weather Dashboard"]
+
+
+def make_router(threshold: float = 0.8) -> QueryRouter:
+    return QueryRouter(VERSION, QUICK_RESPONSES, KEYWORDS, fuzzy_threshold=threshold)
+
+
+class Peek:
+    def __init__(self, replies: Optional[dict] = None):
+        self.replies = replies or {}
+        self.keys: List[str] = []
+
+    def __call__(self, key: str) -> Optional[str]:
+        self.keys.append(key)
+        return self.replies.get(key)
+
+
+def test_keywords_match_whole_words_only():
+    matcher = KeywordMatcher(KEYWORDS)
+    assert matcher.search("does he know java") == "java"
+    assert matcher.search("does he know javascript") is None
+    assert matcher.search("postgresql experience") is None
+    assert matcher.search("sql experience") == "sql"
+    assert matcher.search("is he good at c++") == "c++"
+    assert matcher.search("tell me about the weather dashboard") == "Weather Dashboard"
+
+
+def test_overlapping_keywords_are_all_reported():
+    matcher = KeywordMatcher(KEYWORDS)
+    assert set(matcher.find_all("his tech stack and game logic")) == {
+        "tech stack", "stack", "game logic", "logic"}
+    assert matcher.find_all("python python") == ["python"]
+
+
+def test_fuzzy_matcher_scores_trigram_similarity():
+    matcher = FuzzyMatcher(["who are you", "what is his tech stack"])
+    phrase, score = matcher.best("what s his tech stack")
+    assert phrase == "what is his tech stack" and score > 0.9
+    assert matcher.best("capital of france")[1] < 0.5
+
+
+def test_exact_and_fuzzy_quick_responses():
+    router = make_router()
+    exact = router.route("Who are you?")
+    assert exact.kind == QUICK and exact.reply == "I am the assistant." and exact.score == 1.0
+    fuzzy = router.route("what's his tech stack")
+    assert fuzzy.kind == QUICK and fuzzy.matched == "what is his tech stack"
+
+
+def test_fuzzy_threshold_is_enforced():
+    assert make_router().route("Who are u").kind == REFUSE
+    relaxed = make_router(threshold=0.7).route("Who are u")
+    assert relaxed.kind == QUICK and relaxed.matched == "who are you"
+
+
+def test_fuzzy_match_requires_no_extra_terms():
+    route = make_router().route("tell me about his flask projects")
+    assert route.kind == LLM and route.matched == "flask"
+
+
+def test_irrelevant_queries_are_refused_without_cache_lookup():
+    peek = Peek()
+    assert make_router().route("what is the capital of france", peek).kind == REFUSE
+    assert peek.keys == []
+
+
+def test_greetings_reach_the_model():
+    assert make_router().route("hey").kind == LLM
+
+
+def test_cached_replies_use_the_versioned_global_key():
+    key = global_reply_key("does he know python", VERSION)
+    peek = Peek({key: "Yes."})
+    route = make_router().route("Does he know Python?", peek)
+    assert route.kind == CACHED and route.reply == "Yes."
+    assert peek.keys == [key]
+
+
+def test_follow_up_queries_skip_the_global_cache():
+    normalized = "tell me more about python"
+    peek = Peek({global_reply_key(normalized, VERSION): "Global reply."})
+    route = make_router().route("Tell me more about Python", peek)
+    assert route.kind == LLM and route.is_follow_up
+    assert peek.keys == []
+
+
+def test_route_counts_are_tracked():
+    router = make_router()
+    for query in ("who are you", "capital of france", "python?"):
+        router.route(query)
+    assert router.stats["routes"] == {QUICK: 1, CACHED: 0, REFUSE: 1, LLM: 1}
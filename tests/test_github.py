@@ -0,0 +1,79 @@
+import time
+import uuid
+import pytest
+from app.config import Config
+from app.db import set_cached_github_data, get_github_snapshot
+from app.social.github import GitHubPortfolio
+
+
+def repo(name: str, stars: int = 0) -> dict:
+    return {"name": name, "description": f"{name} repo", "language": "Python",
+            "stargazers_count": stars, "html_url": f"https://github.com/tester/{name}",
+            "pushed_at": "2024-05-01T10:00:00Z", "fork": False}
+
+
+@pytest.fixture
+def portfolio(fake_server, database, monkeypatch):
+    monkeypatch.setattr(Config, "GITHUB_API_URL", fake_server.url)
+    monkeypatch.setattr(Config, "GITHUB_PER_PAGE", 2)
+    monkeypatch.setattr(GitHubPortfolio, "static_projects", property(lambda self: None))
+    monkeypatch.setattr(GitHubPortfolio, "_rate_limit", {"remaining": None, "reset": 0})
+    monkeypatch.setattr(GitHubPortfolio, "_retry_after", {})
+    monkeypatch.setattr(GitHubPortfolio, "_refreshing", set())
+    github = GitHubPortfolio()
+    github.username = "tester"
+    github.base_url = f"{fake_server.url}/users/tester/repos"
+    github.cache_key = f"github_test_{uuid.uuid4().hex}"
+    return github
+
+
+FIRST_PAGE = "/users/tester/repos?per_page=2"
+SECOND_PAGE = "/users/tester/repos?per_page=2&page=2"
+
+
+def add_pages(fake_server, first_extra=(), second_extra=()):
+    fake_server.add(FIRST_PAGE, (200, {
+        "ETag": '"page-1"', "Last-Modified": "Wed, 01 May 2024 10:00:00 GMT",
+        "Link": '<{url}/users/tester/repos?per_page=2&page=2>; rel="next"',
+        "X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "0"
+    }, [repo("alpha", 5), repo("beta", 1)]), *first_extra)
+    fake_server.add(SECOND_PAGE, (200, {
+        "ETag": '"page-2"', "X-RateLimit-Remaining": "49", "X-RateLimit-Reset": "0"
+    }, [repo("gamma", 9), {**repo("forked"), "fork": True}]), *second_extra)
+
+
+def test_sync_follows_pagination_links(fake_server, portfolio):
+    add_pages(fake_server)
+    data = portfolio.sync()
+    assert [page["url"] for page in data["pages"]] == [
+        f"{fake_server.url}{FIRST_PAGE}", f"{fake_server.url}{SECOND_PAGE}"]
+    assert [p["name"] for p in portfolio._select(data, 10, "stars")] == ["gamma", "alpha", "beta"]
+    assert GitHubPortfolio._rate_limit["remaining"] == 49
+
+
+def test_second_sync_is_conditional_and_304_keeps_snapshot(fake_server, portfolio):
+    not_modified = (304, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "0"}, None)
+    add_pages(fake_server, first_extra=[not_modified], second_extra=[not_modified])
+    first = portfolio.sync()
+    second = portfolio.sync()
+    page_one_requests = fake_server.requests_for(FIRST_PAGE)
+    assert "If-None-Match" not in page_one_requests[0]
+    assert page_one_requests[1]["If-None-Match"] == '"page-1"'
+    assert page_one_requests[1]["If-Modified-Since"] == "Wed, 01 May 2024 10:00:00 GMT"
+    assert fake_server.requests_for(SECOND_PAGE)[1]["If-None-Match"] == '"page-2"'
+    assert second == first
+    assert get_github_snapshot(portfolio.cache_key)[0] == first
+    assert GitHubPortfolio._rate_limit["remaining"] == 49
+
+
+def test_expired_snapshot_is_served_while_refreshing(fake_server, portfolio, monkeypatch):
+    add_pages(fake_server)
+    set_cached_github_data(portfolio.cache_key, {"pages": [{"url": "stale", "repos": [
+        portfolio._to_project(repo("stale"))]}]})
+    monkeypatch.setattr(Config, "GITHUB_CACHE_TTL", 0)
+    assert [p["name"] for p in portfolio.get_projects()] == ["stale"]
+    deadline = time.monotonic() + 5
+    while portfolio.cache_key in GitHubPortfolio._refreshing and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert fake_server.requests_for(FIRST_PAGE)
+    assert [p["name"] for p in portfolio.get_projects()] == ["gamma", "alpha", "beta"]
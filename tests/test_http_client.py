@@ -0,0 +1,78 @@
+import time
+import pytest
+import requests
+from app.social.http_client import HttpClient
+
+
+def make_client(**overrides) -> HttpClient:
+    options = dict(max_retries=3, backoff_seconds=0.01, max_backoff_seconds=0.05,
+                   time_budget=5.0, timeout=(1.0, 2.0))
+    options.update(overrides)
+    return HttpClient(**options)
+
+
+def test_server_error_is_retried_until_success(fake_server):
+    fake_server.add("/flaky", (503, {}, {"message": "down"}), (502, {}, None), (200, {}, {"ok": True}))
+    client = make_client()
+    response = client.get(f"{fake_server.url}/flaky")
+    assert response.status_code == 200 and response.json() == {"ok": True}
+    assert len(fake_server.requests_for("/flaky")) == 3
+    host_stats = next(iter(client.stats.values()))
+    assert host_stats["requests"] == 3
+    assert host_stats["retries"] == 2
+    assert host_stats["errors"] == 2
+    assert host_stats["last_status"] == 200
+    assert host_stats["avg_latency_ms"] > 0
+
+
+def test_forbidden_with_retry_after_waits_and_succeeds(fake_server):
+    fake_server.add("/limited", (403, {"Retry-After": "1"}, {"message": "slow down"}), (200, {}, {"ok": True}))
+    started = time.monotonic()
+    response = make_client().get(f"{fake_server.url}/limited")
+    assert response.status_code == 200
+    assert time.monotonic() - started >= 1.0
+
+
+def test_exhausted_rate_limit_waits_for_reset(fake_server):
+    reset = str(int(time.time()) + 1)
+    fake_server.add("/quota", (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}, {}),
+                    (429, {"X-RateLimit-Remaining": "0", "Retry-After": "0"}, {}),
+                    (200, {}, {"ok": True}))
+    client = make_client()
+    assert client.get(f"{fake_server.url}/quota").status_code == 200
+    assert len(fake_server.requests_for("/quota")) == 3
+    assert next(iter(client.stats.values()))["retries"] == 2
+
+
+def test_plain_forbidden_is_not_retried(fake_server):
+    fake_server.add("/private", (403, {}, {"message": "forbidden"}))
+    assert make_client().get(f"{fake_server.url}/private").status_code == 403
+    assert len(fake_server.requests_for("/private")) == 1
+
+
+def test_time_budget_cuts_retries_short(fake_server):
+    fake_server.add("/slow-retry", (429, {"Retry-After": "5"}, {}), (200, {}, {"ok": True}))
+    started = time.monotonic()
+    response = make_client(time_budget=1.0).get(f"{fake_server.url}/slow-retry")
+    assert response.status_code == 429
+    assert time.monotonic() - started < 1.0
+    assert len(fake_server.requests_for("/slow-retry")) == 1
+
+
+def test_network_errors_respect_time_budget():
+    client = make_client(time_budget=0.5, backoff_seconds=1.0, max_backoff_seconds=1.0)
+    started = time.monotonic()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get("http://127.0.0.1:9/unreachable")
+    assert time.monotonic() - started < 2.0
+
+
+def test_connections_are_reused_per_host(fake_server):
+    fake_server.add("/ping", (200, {}, {"ok": True}))
+    client = make_client()
+    for _ in range(5):
+        assert client.get(f"{fake_server.url}/ping").status_code == 200
+    host_stats = next(iter(client.stats.values()))
+    assert host_stats["requests"] == 5
+    assert host_stats["connections"] == 1
+    assert fake_server.connections == 1
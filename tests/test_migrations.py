@@ -0,0 +1,24 @@
+from sqlalchemy import create_engine, inspect, select
+from app.db.migrations import MIGRATIONS, run_migrations, get_applied_versions
+from app.db.models import SchemaVersion
+
+
+def test_empty_database_reaches_latest_version_in_one_pass(tmp_path):
+    bind = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    assert run_migrations(bind) == len(MIGRATIONS)
+    assert get_applied_versions(bind) == {m.version for m in MIGRATIONS}
+    with bind.connect() as conn:
+        assert conn.scalar(select(SchemaVersion.version).order_by(SchemaVersion.version.desc())) == 4
+    indexes = {i["name"] for i in inspect(bind).get_indexes("chat_messages")}
+    assert "ix_chat_messages_session_timestamp" in indexes
+    assert run_migrations(bind) == 0
+
+
+def test_legacy_database_applies_pending_migrations(tmp_path):
+    bind = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with bind.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE chat_messages (id INTEGER PRIMARY KEY, session_id VARCHAR(100), "
+            "user_query TEXT, bot_response TEXT, timestamp DATETIME)")
+    assert run_migrations(bind) == len(MIGRATIONS)
+    assert get_applied_versions(bind) == {m.version for m in MIGRATIONS}